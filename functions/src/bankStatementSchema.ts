@@ -1,37 +1,26 @@
 import { z } from 'zod';
 
+// Compiled once and shared by every numeric field below
+const NON_NUMERIC_PATTERN = /[^0-9.-]+/g;
+
+const toNumber = (val: string | number): number => {
+  if (typeof val === 'number') return val;
+  const num = Number(val.replace(NON_NUMERIC_PATTERN, ""));
+  return isNaN(num) ? 0 : num;
+};
+
 export const BankStatementSchema = z.object({
-  averageMonthlyBalance: z.union([z.string(), z.number()]).transform(val => {
-      if (typeof val === 'number') return val;
-      const num = Number(val.replace(/[^0-9.-]+/g, ""));
-      return isNaN(num) ? 0 : num;
-  }).default(0),
+  averageMonthlyBalance: z.union([z.string(), z.number()]).transform(toNumber).default(0),
 
   cashFlowPattern: z.enum(['positive', 'negative', 'mixed', 'unknown']).default('unknown'),
 
-  loanEMIs: z.union([z.string(), z.number()]).transform(val => {
-      if (typeof val === 'number') return val;
-      const num = Number(val.replace(/[^0-9.-]+/g, ""));
-      return isNaN(num) ? 0 : num;
-  }).default(0),
-
-  chequeBounces: z.union([z.string(), z.number()]).transform(val => {
-    if (typeof val === 'number') return val;
-    const num = Number(val.replace(/[^0-9.-]+/g, ""));
-    return isNaN(num) ? 0 : num;
-  }).default(0),
-
-  totalCredits: z.union([z.string(), z.number()]).transform(val => {
-      if (typeof val === 'number') return val;
-      const num = Number(val.replace(/[^0-9.-]+/g, ""));
-      return isNaN(num) ? 0 : num;
-  }).default(0),
-
-  totalDebits: z.union([z.string(), z.number()]).transform(val => {
-      if (typeof val === 'number') return val;
-      const num = Number(val.replace(/[^0-9.-]+/g, ""));
-      return isNaN(num) ? 0 : num;
-  }).default(0),
+  loanEMIs: z.union([z.string(), z.number()]).transform(toNumber).default(0),
+
+  chequeBounces: z.union([z.string(), z.number()]).transform(toNumber).default(0),
+
+  totalCredits: z.union([z.string(), z.number()]).transform(toNumber).default(0),
+
+  totalDebits: z.union([z.string(), z.number()]).transform(toNumber).default(0),
 
   statementPeriod: z.string().default('Unknown'),
   
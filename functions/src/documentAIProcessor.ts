@@ -29,11 +29,14 @@ const getText = (textAnchor: any, text: string): string => {
     }).join('');
 };
 
+// Newlines, colons and whitespace runs all collapse to a single space
+const CELL_SEPARATOR_PATTERN = /[\s:]+/g;
+
 /**
  * Helper to clean up extracted text
  */
 const cleanText = (text: string): string => {
-    return text.replace(/\n|:/g, ' ').replace(/\s+/g, ' ').trim();
+    return text.replace(CELL_SEPARATOR_PATTERN, ' ').trim();
 };
 
 /**
@@ -42,10 +45,11 @@ const cleanText = (text: string): string => {
 export const tablesToMarkdown = (tables: any[], fullText: string): string => {
     if (!tables || tables.length === 0) return '';
 
-    let markdown = '';
+    // Collect lines and join once; large statements can have thousands of rows
+    const lines: string[] = [];
 
     tables.forEach((table, index) => {
-        markdown += `\n### Table ${index + 1}\n\n`;
+        lines.push(`\n### Table ${index + 1}\n`);
 
         // Process header rows
         if (table.headerRows && table.headerRows.length > 0) {
@@ -54,8 +58,8 @@ export const tablesToMarkdown = (tables: any[], fullText: string): string => {
                 cleanText(getText(cell?.layout?.textAnchor, fullText))
             );
 
-            markdown += `| ${headers.join(' | ')} |\n`;
-            markdown += `| ${headers.map(() => '---').join(' | ')} |\n`;
+            lines.push(`| ${headers.join(' | ')} |`);
+            lines.push(`| ${headers.map(() => '---').join(' | ')} |`);
         }
 
         // Process body rows
@@ -64,13 +68,13 @@ export const tablesToMarkdown = (tables: any[], fullText: string): string => {
                 const rowCells = row.cells.map((cell: any) =>
                     cleanText(getText(cell?.layout?.textAnchor, fullText))
                 );
-                markdown += `| ${rowCells.join(' | ')} |\n`;
+                lines.push(`| ${rowCells.join(' | ')} |`);
             });
         }
-        markdown += '\n';
+        lines.push('');
     });
 
-    return markdown;
+    return lines.join('\n') + '\n';
 };
 
 /**
@@ -92,6 +96,8 @@ export const formFieldsToText = (formFields: any[], fullText: string): string =>
     return textBlocks.join('\n');
 };
 
+let documentAIClient: DocumentProcessorServiceClient | undefined;
+
 /**
  * Orchestrator: Sends PDF to Document AI and returns structured Markdown text
  */
@@ -111,8 +117,8 @@ export const extractStructuredText = async (fileBase64: string, mimeType: string
     const location = 'us';
     const name = `projects/${projectId}/locations/${location}/processors/${processorId}`;
 
-    // Instantiates a client
-    const client = new DocumentProcessorServiceClient();
+    // Reuse one client per instance; creating it sets up a fresh gRPC channel
+    const client = documentAIClient ??= new DocumentProcessorServiceClient();
 
     const request = {
         name,
@@ -136,27 +142,26 @@ export const extractStructuredText = async (fileBase64: string, mimeType: string
         const fullText = document.text;
         const pages = document.pages || [];
 
-        let structuredMarkdown = `# Document AI Structure Extraction\n\n`;
+        // Markdown sections, joined once at the end
+        const sections: string[] = [`# Document AI Structure Extraction\n\n`];
 
         // Adding the raw text ensures Gemini still has access to fine-print (like "Suit Filed") 
         // that might not be captured in a table or form field
-        structuredMarkdown += `## Raw Extracted Text\n${fullText.substring(0, 10000)}...\n\n`;
+        sections.push(`## Raw Extracted Text\n${fullText.substring(0, 10000)}...\n\n`);
 
         pages.forEach((page: any) => {
-            structuredMarkdown += `## Page ${page.pageNumber || 1}\n\n`;
+            sections.push(`## Page ${page.pageNumber || 1}\n\n`);
 
             if (page.formFields && page.formFields.length > 0) {
-                structuredMarkdown += `### Key-Value Pairs\n`;
-                structuredMarkdown += formFieldsToText(page.formFields, fullText);
-                structuredMarkdown += `\n\n`;
+                sections.push(`### Key-Value Pairs\n`, formFieldsToText(page.formFields, fullText), `\n\n`);
             }
 
             if (page.tables && page.tables.length > 0) {
-                structuredMarkdown += tablesToMarkdown(page.tables, fullText);
+                sections.push(tablesToMarkdown(page.tables, fullText));
             }
         });
 
-        return structuredMarkdown;
+        return sections.join('');
 
     } catch (error: any) {
         logger.error('Error processing document with Document AI:', { error: error.message });
@@ -1,4 +1,5 @@
-import { onCall, HttpsError } from "firebase-functions/v2/https";
+import { createHash } from "crypto";
+import { onCall, HttpsError, CallableOptions } from "firebase-functions/v2/https";
 import { logger } from "firebase-functions/v2";
 import { VertexAI } from "@google-cloud/vertexai";
 import { extractStructuredText } from "./documentAIProcessor";
@@ -267,13 +268,18 @@ Return ONLY valid JSON (no markdown fences):
 // Helper: Init Vertex AI and get model
 // ────────────────────────────────────────────────────
 
+// Built on first use and reused for every later request on a warm instance
+let cachedModel: ReturnType<VertexAI["getGenerativeModel"]> | null = null;
+
 const getModel = () => {
+    if (cachedModel) return cachedModel;
+
     const projectId = process.env.GCLOUD_PROJECT || process.env.GCP_PROJECT;
     if (!projectId) throw new HttpsError("internal", "GCP project ID not found.");
 
     const vertexAI = new VertexAI({ project: projectId, location: "us-central1" });
 
-    return vertexAI.getGenerativeModel({
+    cachedModel = vertexAI.getGenerativeModel({
         model: "gemini-2.0-flash-001",
         generationConfig: {
             temperature: 0.1,
@@ -281,12 +287,28 @@ const getModel = () => {
             responseMimeType: "application/json",
         },
     });
+    return cachedModel;
 };
 
 // ────────────────────────────────────────────────────
 // Shared extraction logic
 // ────────────────────────────────────────────────────
 
+// Markdown code fences Gemini sometimes wraps around its JSON output
+const LEADING_FENCE_PATTERN = /^```json?\s*/i;
+const TRAILING_FENCE_PATTERN = /```\s*$/i;
+
+/**
+ * Locates the JSON body between optional code fences by index on the original
+ * response, so only the final slice is copied rather than each stripped stage.
+ */
+const stripJsonFence = (text: string): string => {
+    const start = LEADING_FENCE_PATTERN.exec(text)?.[0].length ?? 0;
+    const trailing = TRAILING_FENCE_PATTERN.exec(text);
+    const end = trailing ? Math.max(start, trailing.index) : text.length;
+    return text.slice(start, end).trim();
+};
+
 const extractWithGeminiVision = async (
     fileBase64OrText: string,
     mimeType: string,
@@ -317,24 +339,56 @@ const extractWithGeminiVision = async (
     if (!responseText) throw new HttpsError("internal", "Empty response from AI model.");
 
     try {
-        const cleaned = responseText.replace(/^```json?\s*/i, "").replace(/```\s*$/i, "").trim();
-        return JSON.parse(cleaned);
+        return JSON.parse(stripJsonFence(responseText));
     } catch {
         logger.error("JSON parse failure", { preview: responseText.substring(0, 500) });
         throw new HttpsError("internal", "AI returned invalid JSON. Please try again.");
     }
 };
 
+/**
+ * Hybrid extraction for document types with a Document AI processor: Document
+ * AI lays out tables and form fields, then Gemini reasons over that structured
+ * text. Without a configured processor, or when Document AI fails, Gemini
+ * Vision reads the raw file instead and `usedFallback` is set.
+ */
+const extractWithDocumentAI = async (
+    fileBase64: string,
+    mimeType: string,
+    docType: DocumentType,
+    processorId: string | undefined
+) => {
+    if (!processorId) {
+        logger.warn("Document AI processor ID is not configured, using Gemini Vision", { docType });
+        return { data: await extractWithGeminiVision(fileBase64, mimeType, docType), usedFallback: true };
+    }
+
+    let structuredText: string;
+    try {
+        structuredText = await extractStructuredText(fileBase64, mimeType, processorId);
+    } catch (docAIError) {
+        logger.warn("Document AI extraction failed, falling back to Gemini Vision", { docType, error: docAIError });
+        return { data: await extractWithGeminiVision(fileBase64, mimeType, docType), usedFallback: true };
+    }
+
+    logger.info("Document AI extraction successful", { docType });
+    return { data: await extractWithGeminiVision(structuredText, "text/plain", docType, true), usedFallback: false };
+};
+
 // ────────────────────────────────────────────────────
 // Validate shared inputs
 // ────────────────────────────────────────────────────
 
-const ALLOWED_MIME_TYPES = ["application/pdf", "image/png", "image/jpeg", "image/webp"];
+// Fixed vocabularies are kept as Sets so membership is a hash lookup
+const ALLOWED_MIME_TYPES = new Set(["application/pdf", "image/png", "image/jpeg", "image/webp"]);
 const MAX_SIZE_BYTES = 15 * 1024 * 1024;
-const ALLOWED_DOC_TYPES: DocumentType[] = [
+const ALLOWED_DOC_TYPES = new Set<DocumentType>([
     "cibil_report", "balance_sheet", "profit_loss",
     "bank_statement", "gst_returns", "itr_document"
-];
+]);
+
+// Decoded byte size of a base64 payload, computed without decoding it
+const decodedSize = (fileBase64: string): number => Buffer.byteLength(fileBase64, "base64");
 
 const validateRequest = (request: any) => {
     if (!request.auth) {
@@ -347,15 +401,15 @@ const validateRequest = (request: any) => {
         throw new HttpsError("invalid-argument", "fileBase64, mimeType, and documentType are required.");
     }
 
-    if (!ALLOWED_MIME_TYPES.includes(mimeType)) {
+    if (!ALLOWED_MIME_TYPES.has(mimeType)) {
         throw new HttpsError("invalid-argument", `Unsupported file type: ${mimeType}.`);
     }
 
-    if (!ALLOWED_DOC_TYPES.includes(documentType)) {
+    if (!ALLOWED_DOC_TYPES.has(documentType)) {
         throw new HttpsError("invalid-argument", `Unknown document type: ${documentType}.`);
     }
 
-    const fileSizeBytes = Buffer.from(fileBase64, "base64").length;
+    const fileSizeBytes = decodedSize(fileBase64);
     if (fileSizeBytes > MAX_SIZE_BYTES) {
         throw new HttpsError("invalid-argument", `File too large (${(fileSizeBytes / 1024 / 1024).toFixed(1)}MB). Maximum is 15MB.`);
     }
@@ -363,12 +417,50 @@ const validateRequest = (request: any) => {
     return { fileBase64, mimeType, documentType: documentType as DocumentType, fileSizeBytes };
 };
 
+// ────────────────────────────────────────────────────
+// Extraction result cache (per warm instance)
+// ────────────────────────────────────────────────────
+
+// Validated results keyed by document type + content hash (LRU). Gemini Vision
+// fallback results are not cached.
+const RESULT_CACHE_SIZE = 64;
+const resultCache = new Map<string, any>();
+
+const getCacheKey = (docType: DocumentType, fileBase64: string): string =>
+    `${docType}:${createHash("blake2b512").update(fileBase64).digest("base64")}`;
+
+const getCachedResult = (key: string) => {
+    const hit = resultCache.get(key);
+    if (hit !== undefined) {
+        // Re-insert to mark as most recently used
+        resultCache.delete(key);
+        resultCache.set(key, hit);
+    }
+    return hit;
+};
+
+const setCachedResult = (key: string, data: any) => {
+    resultCache.set(key, data);
+    if (resultCache.size > RESULT_CACHE_SIZE) {
+        resultCache.delete(resultCache.keys().next().value!);
+    }
+};
+
+// Shared by both extraction callables; a few requests per instance at a time
+const EXTRACTION_FUNCTION_OPTIONS: CallableOptions = {
+    region: "us-central1",
+    timeoutSeconds: 120,
+    memory: "512MiB",
+    concurrency: 4,
+    maxInstances: 10,
+};
+
 // ────────────────────────────────────────────────────
 // Cloud Function: extractCibilReport (backwards compat)
 // ────────────────────────────────────────────────────
 
 export const extractCibilReport = onCall(
-    { region: "us-central1", timeoutSeconds: 120, memory: "512MiB", maxInstances: 10 },
+    EXTRACTION_FUNCTION_OPTIONS,
     async (request) => {
         if (!request.auth) {
             throw new HttpsError("unauthenticated", "You must be logged in to extract CIBIL reports.");
@@ -380,11 +472,11 @@ export const extractCibilReport = onCall(
             throw new HttpsError("invalid-argument", "fileBase64 and mimeType are required.");
         }
 
-        if (!ALLOWED_MIME_TYPES.includes(mimeType)) {
+        if (!ALLOWED_MIME_TYPES.has(mimeType)) {
             throw new HttpsError("invalid-argument", `Unsupported file type: ${mimeType}.`);
         }
 
-        const fileSizeBytes = Buffer.from(fileBase64, "base64").length;
+        const fileSizeBytes = decodedSize(fileBase64);
         if (fileSizeBytes > MAX_SIZE_BYTES) {
             throw new HttpsError("invalid-argument", `File too large.`);
         }
@@ -395,29 +487,23 @@ export const extractCibilReport = onCall(
             fileSizeMB: (fileSizeBytes / 1024 / 1024).toFixed(2),
         });
 
-        try {
-            let structuredText: string;
-            const processorId = process.env.DOCUMENT_AI_CIBIL_PROCESSOR_ID;
-
-            try {
-                // Phase 1: Use Document AI to get structured markdown tables and form fields
-                structuredText = await extractStructuredText(fileBase64, mimeType, processorId!);
-                logger.info("Document AI extraction successful for CIBIL");
-            } catch (docAIError) {
-                logger.warn("Document AI extraction failed, falling back to raw Gemini Vision processing", { error: docAIError });
-                // Fallback to exactly what the code did before: pass base64 directly to Gemini
-                const rawData = await extractWithGeminiVision(fileBase64, mimeType, "cibil_report");
-                const validatedFallback = validateCibilData(rawData);
-                return { success: true, data: validatedFallback };
-            }
+        const cacheKey = getCacheKey("cibil_report", fileBase64);
+        const cached = getCachedResult(cacheKey);
+        if (cached) {
+            logger.info("extractCibilReport cache hit", { userId: request.auth.uid });
+            return { success: true, data: cached };
+        }
 
-            // Phase 2: Use Gemini to reason over the structured text and extract the exact fields
-            const extractedJson = await extractWithGeminiVision(structuredText, "text/plain", "cibil_report", true);
+        try {
+            const { data: extractedJson, usedFallback } = await extractWithDocumentAI(
+                fileBase64, mimeType, "cibil_report", process.env.DOCUMENT_AI_CIBIL_PROCESSOR_ID
+            );
 
-            // Phase 3: Validate the JSON with Zod
+            // Validate the JSON with Zod
             const validatedData = validateCibilData(extractedJson);
 
             logger.info("CIBIL extracted & validated", { userId: request.auth.uid, score: validatedData.cibilScore });
+            if (!usedFallback) setCachedResult(cacheKey, validatedData);
             return { success: true, data: validatedData };
         } catch (error: any) {
             if (error instanceof HttpsError) throw error;
@@ -432,7 +518,7 @@ export const extractCibilReport = onCall(
 // ────────────────────────────────────────────────────
 
 export const extractMsmeDocument = onCall(
-    { region: "us-central1", timeoutSeconds: 120, memory: "512MiB", maxInstances: 10 },
+    EXTRACTION_FUNCTION_OPTIONS,
     async (request) => {
         const { fileBase64, mimeType, documentType, fileSizeBytes } = validateRequest(request);
 
@@ -443,45 +529,37 @@ export const extractMsmeDocument = onCall(
             fileSizeMB: (fileSizeBytes / 1024 / 1024).toFixed(2),
         });
 
+        const cacheKey = getCacheKey(documentType, fileBase64);
+        const cached = getCachedResult(cacheKey);
+        if (cached) {
+            logger.info("extractMsmeDocument cache hit", { userId: request.auth!.uid, documentType });
+            return { success: true, documentType, data: cached };
+        }
+
         try {
-            let structuredText: string;
-            
             if (documentType === "cibil_report") {
-                const processorId = process.env.DOCUMENT_AI_CIBIL_PROCESSOR_ID;
-                try {
-                    structuredText = await extractStructuredText(fileBase64, mimeType, processorId!);
-                } catch (docAIError) {
-                    logger.warn("Document AI failed for generic extractMsmeDocument, falling back to Vision", { error: docAIError });
-                    const rawData = await extractWithGeminiVision(fileBase64, mimeType, "cibil_report");
-                    const validatedFallbackData = validateCibilData(rawData);
-                    return { success: true, documentType, data: validatedFallbackData };
-                }
-
-                const rawExtracted = await extractWithGeminiVision(structuredText, "text/plain", "cibil_report", true);
+                const { data: rawExtracted, usedFallback } = await extractWithDocumentAI(
+                    fileBase64, mimeType, documentType, process.env.DOCUMENT_AI_CIBIL_PROCESSOR_ID
+                );
                 const data = validateCibilData(rawExtracted);
-                logger.info("Document extracted (hybrid CIBIL)", { userId: request.auth!.uid, documentType });
+                if (!usedFallback) setCachedResult(cacheKey, data);
+                logger.info("Document extracted (CIBIL)", { userId: request.auth!.uid, documentType });
                 return { success: true, documentType, data };
             }
-            
+
             if (documentType === "bank_statement") {
-                const processorId = process.env.DOCUMENT_AI_BANK_PROCESSOR_ID;
-                 try {
-                    structuredText = await extractStructuredText(fileBase64, mimeType, processorId!);
-                } catch (docAIError) {
-                    logger.warn("Document AI Bank Parser failed, falling back to Vision", { error: docAIError });
-                    const rawData = await extractWithGeminiVision(fileBase64, mimeType, "bank_statement");
-                    const validatedFallbackData = validateBankStatementData(rawData);
-                    return { success: true, documentType, data: validatedFallbackData };
-                }
-
-                const rawExtracted = await extractWithGeminiVision(structuredText, "text/plain", "bank_statement", true);
+                const { data: rawExtracted, usedFallback } = await extractWithDocumentAI(
+                    fileBase64, mimeType, documentType, process.env.DOCUMENT_AI_BANK_PROCESSOR_ID
+                );
                 const data = validateBankStatementData(rawExtracted);
-                logger.info("Document extracted (hybrid Bank Statement)", { userId: request.auth!.uid, documentType });
+                if (!usedFallback) setCachedResult(cacheKey, data);
+                logger.info("Document extracted (Bank Statement)", { userId: request.auth!.uid, documentType });
                 return { success: true, documentType, data };
             }
 
             // For non-CIBIL, non-Bank documents, continue using pure Gemini Vision
             const data = await extractWithGeminiVision(fileBase64, mimeType, documentType);
+            setCachedResult(cacheKey, data);
             logger.info("Document extracted (vision)", { userId: request.auth!.uid, documentType });
             return { success: true, documentType, data };
         } catch (error: any) {
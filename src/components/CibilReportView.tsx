@@ -61,6 +61,11 @@ export interface CibilData {
     }[];
 }
 
+// Payment status codes: a status is healthy when it consists only of
+// 0 / STD characters, and critical when it carries an NPA classification
+const HEALTHY_STATUS_PATTERN = /^[0STD]*$/;
+const RISK_STATUS_PATTERN = /SUB|DBT|LSS/;
+
 interface CibilReportViewProps {
     data: CibilData;
     aiAnalysis?: string;
@@ -91,12 +96,16 @@ const MiniMetric = ({ label, value, icon: Icon, alert = false, highlight = false
 
 const CibilReportView: React.FC<CibilReportViewProps> = ({ data, aiAnalysis }) => {
     const [filter, setFilter] = React.useState<'all' | 'active' | 'overdue'>('all');
-    const [expandedRows, setExpandedRows] = React.useState<number[]>([]);
+    // A Set keeps the per-row expanded check constant-time while rendering
+    // long account lists
+    const [expandedRows, setExpandedRows] = React.useState<Set<number>>(() => new Set());
 
     const toggleRow = (idx: number) => {
-        setExpandedRows(prev =>
-            prev.includes(idx) ? prev.filter(i => i !== idx) : [...prev, idx]
-        );
+        setExpandedRows(prev => {
+            const next = new Set(prev);
+            if (!next.delete(idx)) next.add(idx);
+            return next;
+        });
     };
 
     const filteredAccounts = data.accounts.filter(acc => {
@@ -105,8 +114,13 @@ const CibilReportView: React.FC<CibilReportViewProps> = ({ data, aiAnalysis }) =
         return true;
     });
 
-    const activeCount = data.accounts.filter(acc => acc.currentBalance > 0).length;
-    const overdueCount = data.accounts.filter(acc => acc.amountOverdue > 0).length;
+    // Count active and overdue accounts in a single pass over the report
+    let activeCount = 0;
+    let overdueCount = 0;
+    for (const acc of data.accounts) {
+        if (acc.currentBalance > 0) activeCount++;
+        if (acc.amountOverdue > 0) overdueCount++;
+    }
     const totalCount = data.accounts.length;
 
     const numericScore = data.cibilScore || 0;
@@ -124,11 +138,10 @@ const CibilReportView: React.FC<CibilReportViewProps> = ({ data, aiAnalysis }) =
     const getStatusSummary = (status: string) => {
         if (!status) return { label: "Unknown", color: "text-slate-400", bg: "bg-slate-50", icon: HelpCircle };
         
-        const isHealthy = status.split('').every(char => char === '0' || char === 'S' || char === 'T' || char === 'D');
-        const hasRiskChars = /SUB|DBT|LSS/.test(status);
-        
-        if (hasRiskChars) return { label: "Critical Risk", color: "text-rose-700", bg: "bg-rose-50", icon: AlertOctagon };
-        if (!isHealthy) return { label: "Delayed Payments", color: "text-amber-700", bg: "bg-amber-50", icon: AlertTriangle };
+        // Risk codes decide the outcome on their own, so only scan for a
+        // fully healthy history when none are present
+        if (RISK_STATUS_PATTERN.test(status)) return { label: "Critical Risk", color: "text-rose-700", bg: "bg-rose-50", icon: AlertOctagon };
+        if (!HEALTHY_STATUS_PATTERN.test(status)) return { label: "Delayed Payments", color: "text-amber-700", bg: "bg-amber-50", icon: AlertTriangle };
         
         return { label: "Regular Performance", color: "text-emerald-700", bg: "bg-emerald-50", icon: ShieldCheck };
     };
@@ -286,7 +299,7 @@ const CibilReportView: React.FC<CibilReportViewProps> = ({ data, aiAnalysis }) =
                     </TableHeader>
                     <TableBody>
                         {filteredAccounts.map((acc, idx) => {
-                            const isExpanded = expandedRows.includes(idx);
+                            const isExpanded = expandedRows.has(idx);
                             const utilization = acc.sanctionedAmount > 0 ? (acc.currentBalance / acc.sanctionedAmount) * 100 : 0;
                             const statusInfo = getStatusSummary(acc.paymentStatus);
 
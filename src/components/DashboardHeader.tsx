@@ -47,6 +47,9 @@ const DashboardHeader = ({ onSidebarToggle }: DashboardHeaderProps) => {
   const [showMobileSearch, setShowMobileSearch] = useState(false);
   const [searchQuery, setSearchQuery] = useState('');
   const [isSearchFocused, setIsSearchFocused] = useState(false);
+  const [recentSearches, setRecentSearches] = useState<string[]>(() =>
+    JSON.parse(localStorage.getItem('recentSearches') || '[]')
+  );
 
   const displayName = user?.displayName || user?.email || 'User';
 
@@ -63,16 +66,16 @@ const DashboardHeader = ({ onSidebarToggle }: DashboardHeaderProps) => {
     { name: 'Help & Support', path: '/help-support', icon: HelpCircle, category: 'Pages' },
   ];
 
+  const query = searchQuery.toLowerCase();
+
   const filteredPages = searchQuery 
-    ? PAGES.filter(p => p.name.toLowerCase().includes(searchQuery.toLowerCase()))
+    ? PAGES.filter(p => p.name.toLowerCase().includes(query))
     : PAGES.slice(0, 4);
 
   const filteredDocs = searchQuery
-    ? documents.filter(d => d.fileName.toLowerCase().includes(searchQuery.toLowerCase()))
+    ? documents.filter(d => d.fileName.toLowerCase().includes(query))
     : documents.slice(0, 3);
 
-  const recentSearches = JSON.parse(localStorage.getItem('recentSearches') || '[]');
-
   const handleSearchSelect = (item: any) => {
     if (item.path) {
       navigate(item.path);
@@ -82,7 +85,8 @@ const DashboardHeader = ({ onSidebarToggle }: DashboardHeaderProps) => {
     }
     
     // Save to recent
-    const newRecent = [searchQuery || item.name || item.fileName, ...recentSearches.filter((s: string) => s !== (searchQuery || item.name || item.fileName))].slice(0, 5);
+    const newRecent = [searchQuery || item.name || item.fileName, ...recentSearches.filter(s => s !== (searchQuery || item.name || item.fileName))].slice(0, 5);
+    setRecentSearches(newRecent);
     localStorage.setItem('recentSearches', JSON.stringify(newRecent));
     
     setIsSearchFocused(false);
@@ -91,9 +95,9 @@ const DashboardHeader = ({ onSidebarToggle }: DashboardHeaderProps) => {
 
   const handleClearRecent = (e: React.MouseEvent, search: string) => {
     e.stopPropagation();
-    const newRecent = recentSearches.filter((s: string) => s !== search);
+    const newRecent = recentSearches.filter(s => s !== search);
+    setRecentSearches(newRecent);
     localStorage.setItem('recentSearches', JSON.stringify(newRecent));
-    // Force re-render if needed or just let the next render catch it
   };
 
   return (
@@ -148,7 +152,7 @@ const DashboardHeader = ({ onSidebarToggle }: DashboardHeaderProps) => {
                         {/* Recent Searches */}
                         {recentSearches.length > 0 && !searchQuery && (
                           <div className="space-y-1">
-                            {recentSearches.map((s: string) => (
+                            {recentSearches.map(s => (
                               <div 
                                 key={s} 
                                 className="flex items-center justify-between group/row px-3 py-2 rounded-lg hover:bg-slate-800/80 cursor-pointer transition-colors"
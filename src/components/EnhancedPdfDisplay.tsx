@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useMemo } from 'react';
 import { motion } from 'framer-motion';
 import { 
   FileText, 
@@ -17,6 +17,7 @@ import { Badge } from '@/components/ui/badge';
 import { Progress } from '@/components/ui/progress';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import { ExtractedData } from '@/hooks/useFileExtraction';
+import { getTextStats } from '@/utils/textStats';
 
 interface EnhancedPdfDisplayProps {
   extractedData: ExtractedData;
@@ -27,6 +28,7 @@ const EnhancedPdfDisplay: React.FC<EnhancedPdfDisplayProps> = ({ extractedData,
   const metadata = extractedData.metadata;
   const isEnhanced = metadata?.enhancedExtraction;
   const hasOCR = metadata?.extractionMethods?.includes('ocr') || metadata?.ocrPagesProcessed > 0;
+  const stats = useMemo(() => getTextStats(extractedData.extractedText), [extractedData.extractedText]);
   
   const getConfidenceColor = (confidence: number) => {
     if (confidence >= 0.8) return 'text-green-600 bg-green-100';
@@ -264,7 +266,7 @@ const EnhancedPdfDisplay: React.FC<EnhancedPdfDisplayProps> = ({ extractedData,
                   <span className="font-medium">{metadata.totalPages}</span>
                 </div>
               )}
-              {metadata?.pagesWithText && (
+              {metadata?.pagesWithText != null && (
                 <div className="flex justify-between">
                   <span className="text-gray-600">Pages with text:</span>
                   <span className="font-medium">{metadata.pagesWithText}</span>
@@ -309,25 +311,25 @@ const EnhancedPdfDisplay: React.FC<EnhancedPdfDisplayProps> = ({ extractedData,
             <div className="grid grid-cols-2 md:grid-cols-4 gap-4 text-sm">
               <div className="text-center p-3 bg-gray-50 rounded-lg">
                 <div className="text-xl font-bold text-gray-700">
-                  {extractedData.extractedText.length.toLocaleString()}
+                  {stats.characters.toLocaleString()}
                 </div>
                 <div className="text-gray-600">Characters</div>
               </div>
               <div className="text-center p-3 bg-gray-50 rounded-lg">
                 <div className="text-xl font-bold text-gray-700">
-                  {extractedData.extractedText.split(/\s+/).filter(w => w.length > 0).length.toLocaleString()}
+                  {stats.words.toLocaleString()}
                 </div>
                 <div className="text-gray-600">Words</div>
               </div>
               <div className="text-center p-3 bg-gray-50 rounded-lg">
                 <div className="text-xl font-bold text-gray-700">
-                  {extractedData.extractedText.split(/[.!?]+/).filter(s => s.trim().length > 0).length}
+                  {stats.sentences}
                 </div>
                 <div className="text-gray-600">Sentences</div>
               </div>
               <div className="text-center p-3 bg-gray-50 rounded-lg">
                 <div className="text-xl font-bold text-gray-700">
-                  {extractedData.extractedText.split(/\n\s*\n/).filter(p => p.trim().length > 0).length}
+                  {stats.paragraphs}
                 </div>
                 <div className="text-gray-600">Paragraphs</div>
               </div>
@@ -22,14 +22,22 @@ import { Input } from '@/components/ui/input';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import { useToast } from '@/components/ui/use-toast';
 import { ExtractedData } from '@/hooks/useFileExtraction';
-import { FinancialDataExtractor } from '@/utils/financialDataExtractor';
+import { extractFinancialData } from '@/utils/financialDataExtractor';
 import FinancialDataTable from '@/components/FinancialDataTable';
+import { getTextStats } from '@/utils/textStats';
+import { extractKeyInformation } from '@/utils/keyInformation';
 
 interface PdfViewerProps {
   extractedData: ExtractedData;
   onClose?: () => void;
 }
 
+// camelCase humps and underscores both become spaces
+const METADATA_KEY_SEPARATOR_PATTERN = /([A-Z])|_/g;
+
+const formatMetadataKey = (key: string) =>
+  key.replace(METADATA_KEY_SEPARATOR_PATTERN, (_, upper) => (upper ? ` ${upper}` : ' '));
+
 const PdfViewer: React.FC<PdfViewerProps> = ({ extractedData, onClose }) => {
   const { toast } = useToast();
   const [searchTerm, setSearchTerm] = useState('');
@@ -39,8 +47,7 @@ const PdfViewer: React.FC<PdfViewerProps> = ({ extractedData, onClose }) => {
   // Extract financial data using the intelligent extractor
   const financialData = useMemo(() => {
     if (!extractedData.extractedText) return null;
-    const extractor = new FinancialDataExtractor(extractedData.extractedText);
-    return extractor.extractAll();
+    return extractFinancialData(extractedData.extractedText);
   }, [extractedData.extractedText]);
 
   const copyToClipboard = async (text: string) => {
@@ -78,55 +85,9 @@ const PdfViewer: React.FC<PdfViewerProps> = ({ extractedData, onClose }) => {
     return text.replace(regex, '<mark class="bg-yellow-200 px-1 rounded">$1</mark>');
   };
 
-  const getTextStats = () => {
-    const text = extractedData.extractedText;
-    const words = text.split(/\s+/).filter(word => word.length > 0);
-    const sentences = text.split(/[.!?]+/).filter(sentence => sentence.trim().length > 0);
-    const paragraphs = text.split(/\n\s*\n/).filter(para => para.trim().length > 0);
-    
-    return {
-      characters: text.length,
-      words: words.length,
-      sentences: sentences.length,
-      paragraphs: paragraphs.length
-    };
-  };
-
-  const extractKeyInformation = () => {
-    const text = extractedData.extractedText.toLowerCase();
-    const info: Record<string, string[]> = {
-      emails: [],
-      phones: [],
-      dates: [],
-      amounts: [],
-      names: []
-    };
-
-    // Extract emails
-    const emailRegex = /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/g;
-    info.emails = [...new Set(extractedData.extractedText.match(emailRegex) || [])];
-
-    // Extract phone numbers
-    const phoneRegex = /(\+?1?[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})/g;
-    info.phones = [...new Set(extractedData.extractedText.match(phoneRegex) || [])];
-
-    // Extract dates
-    const dateRegex = /\b\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4}\b|\b\d{4}[\/\-\.]\d{1,2}[\/\-\.]\d{1,2}\b/g;
-    info.dates = [...new Set(extractedData.extractedText.match(dateRegex) || [])];
-
-    // Extract monetary amounts
-    const amountRegex = /\$[\d,]+\.?\d*/g;
-    info.amounts = [...new Set(extractedData.extractedText.match(amountRegex) || [])];
-
-    // Extract potential names (capitalized words)
-    const nameRegex = /\b[A-Z][a-z]+ [A-Z][a-z]+\b/g;
-    info.names = [...new Set(extractedData.extractedText.match(nameRegex) || [])].slice(0, 10);
-
-    return info;
-  };
-
-  const stats = getTextStats();
-  const keyInfo = extractKeyInformation();
+  // Derived once per extracted text
+  const stats = useMemo(() => getTextStats(extractedData.extractedText), [extractedData.extractedText]);
+  const keyInfo = useMemo(() => extractKeyInformation(extractedData.extractedText), [extractedData.extractedText]);
 
   return (
     <div className="w-full p-6 space-y-6">
@@ -399,7 +360,7 @@ const PdfViewer: React.FC<PdfViewerProps> = ({ extractedData, onClose }) => {
                         {Object.entries(extractedData.metadata).map(([key, value]) => (
                           <div key={key} className="flex justify-between items-start">
                             <span className="text-gray-600 capitalize font-medium">
-                              {key.replace(/([A-Z])/g, ' $1').replace(/_/g, ' ')}:
+                              {formatMetadataKey(key)}:
                             </span>
                             <span className="font-mono text-right max-w-32 break-words">
                               {typeof value === 'object' ? JSON.stringify(value, null, 2) : String(value)}
@@ -13,43 +13,96 @@ export interface ExtractedData {
     error?: string;
 }
 
+// Upper bound on pages being extracted at the same time
+const MAX_CONCURRENT_PAGES = 4;
+
+const NON_WHITESPACE_PATTERN = /\S/;
+
+interface PdfTextResult {
+    text: string;
+    totalPages: number;
+    pagesWithText: number;
+}
+
 export const useFileExtraction = () => {
     const [isProcessing, setIsProcessing] = useState(false);
     const [extractedData, setExtractedData] = useState<ExtractedData | null>(null);
     const [progress, setProgress] = useState({ current: 0, total: 0, stage: '', percentage: 0 });
 
-    const extractTextFromPdf = useCallback(async (file: File): Promise<string> => {
+    const extractTextFromPdf = useCallback(async (file: File): Promise<PdfTextResult> => {
         try {
-            // Dynamic import of pdfjs-dist
-            const pdfjsLib = await import('pdfjs-dist');
-            const pdfWorker = await import('pdfjs-dist/build/pdf.worker.mjs?url');
+            // Dynamic import of pdfjs-dist, its worker and the file bytes, loaded together
+            const [pdfjsLib, pdfWorker, arrayBuffer] = await Promise.all([
+                import('pdfjs-dist'),
+                import('pdfjs-dist/build/pdf.worker.mjs?url'),
+                file.arrayBuffer()
+            ]);
             
             // Set worker source
             pdfjsLib.GlobalWorkerOptions.workerSrc = pdfWorker.default;
             
-            const arrayBuffer = await file.arrayBuffer();
-            const pdf = await pdfjsLib.getDocument({ data: arrayBuffer }).promise;
+            // Only the text layer is read, so skip turning embedded fonts into
+            // browser FontFace objects; glyph-to-text mapping still happens in
+            // the worker
+            const pdf = await pdfjsLib.getDocument({ data: arrayBuffer, disableFontFace: true }).promise;
             
-            let fullText = '';
             const totalPages = pdf.numPages;
-            
-            for (let pageNum = 1; pageNum <= totalPages; pageNum++) {
-                setProgress({
-                    current: pageNum,
-                    total: totalPages,
-                    stage: `Extracting page ${pageNum} of ${totalPages}`,
-                    percentage: Math.round((pageNum / totalPages) * 100)
-                });
-                
-                const page = await pdf.getPage(pageNum);
-                const textContent = await page.getTextContent();
-                const pageText = textContent.items
-                    .map((item: any) => item.str)
-                    .join(' ');
-                fullText += pageText + '\n\n';
+            const pageTexts: string[] = new Array(totalPages);
+            // 1 where the page at the same index has non-whitespace text
+            const pageHasText = new Uint8Array(totalPages);
+            let nextPage = 0;
+            let pagesDone = 0;
+            let lastPercentage = -1;
+
+            // Pages are independent, so a small pool of workers pulls page
+            // numbers off a shared counter and extracts them concurrently.
+            // Bounding the pool keeps only a few pages resident at a time on
+            // large reports. Results are stored by index to keep document order.
+            const extractNextPages = async () => {
+                while (nextPage < totalPages) {
+                    const index = nextPage++;
+                    const page = await pdf.getPage(index + 1);
+                    const textContent = await page.getTextContent();
+                    // Scanned/image-only pages have no text items; skip the
+                    // string building for them entirely
+                    const pageText = textContent.items.length > 0
+                        ? textContent.items.map((item: any) => item.str).join(' ')
+                        : '';
+                    pageTexts[index] = pageText;
+                    pageHasText[index] = NON_WHITESPACE_PATTERN.test(pageText) ? 1 : 0;
+                    page.cleanup();
+
+                    pagesDone++;
+                    // Each progress update re-renders the consumer, so only
+                    // publish when the visible percentage actually moves
+                    const percentage = Math.round((pagesDone / totalPages) * 100);
+                    if (percentage !== lastPercentage) {
+                        lastPercentage = percentage;
+                        setProgress({
+                            current: pagesDone,
+                            total: totalPages,
+                            stage: `Extracting page ${pagesDone} of ${totalPages}`,
+                            percentage
+                        });
+                    }
+                }
+            };
+
+            // pdf.js funnels every page through a single document worker, so
+            // beyond a handful of in-flight pages extra concurrency only keeps
+            // more pages resident without finishing any sooner
+            const poolSize = Math.min(totalPages, navigator.hardwareConcurrency || 1, MAX_CONCURRENT_PAGES);
+            try {
+                await Promise.all(Array.from({ length: poolSize }, extractNextPages));
+            } finally {
+                // Release the parsed document and its worker-side caches
+                await pdf.destroy();
             }
             
-            return fullText.trim();
+            // Blank pages would only add empty separators to the joined text
+            const text = pageTexts.filter((_, index) => pageHasText[index]).join('\n\n').trim();
+            const pagesWithText = pageHasText.reduce((count, hasText) => count + hasText, 0);
+            return { text, totalPages, pagesWithText };
         } catch (error) {
             console.error('PDF extraction error:', error);
             throw new Error('Failed to extract text from PDF. Please try another file.');
@@ -123,7 +176,9 @@ export const useFileExtraction = () => {
                 file.name.endsWith('.xls')) {
                 // Excel file processing
                 const arrayBuffer = await file.arrayBuffer();
-                const workbook = XLSX.read(arrayBuffer, { type: 'array' });
+                // Only the first sheet is shown, so leave the others unparsed;
+                // SheetNames still lists every sheet in the workbook
+                const workbook = XLSX.read(arrayBuffer, { type: 'array', sheets: 0 });
 
                 // Get first sheet
                 const sheetName = workbook.SheetNames[0];
@@ -148,10 +203,13 @@ export const useFileExtraction = () => {
             else if (file.type === 'application/pdf' || file.name.toLowerCase().endsWith('.pdf')) {
                 // PDF processing with pdf.js
                 setProgress({ current: 0, total: 1, stage: 'Loading PDF...', percentage: 40 });
-                result.extractedText = await extractTextFromPdf(file);
+                const { text, totalPages, pagesWithText } = await extractTextFromPdf(file);
+                result.extractedText = text;
                 
                 result.metadata = {
                     ...result.metadata,
+                    totalPages,
+                    pagesWithText,
                     note: 'Text extracted using PDF.js'
                 };
             }
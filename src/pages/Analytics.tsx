@@ -28,16 +28,25 @@ const Analytics = () => {
   const { user } = useAuth();
   const { applications } = useApplications();
 
-  // Calculate analytics data
+  // Calculate analytics data: status counts and loan totals in one pass
   const totalApplications = applications.length;
-  const pendingApplications = applications.filter(app => app.status === 'pending').length;
-  const approvedApplications = applications.filter(app => app.status === 'approved').length;
-  const rejectedApplications = applications.filter(app => app.status === 'rejected').length;
+  let pendingApplications = 0;
+  let approvedApplications = 0;
+  let rejectedApplications = 0;
+  let totalLoanAmount = 0;
+  let approvedLoanAmount = 0;
 
-  const totalLoanAmount = applications.reduce((sum, app) => sum + app.loanAmount, 0);
-  const approvedLoanAmount = applications
-    .filter(app => app.status === 'approved')
-    .reduce((sum, app) => sum + app.loanAmount, 0);
+  for (const app of applications) {
+    totalLoanAmount += app.loanAmount;
+    if (app.status === 'pending') {
+      pendingApplications++;
+    } else if (app.status === 'approved') {
+      approvedApplications++;
+      approvedLoanAmount += app.loanAmount;
+    } else if (app.status === 'rejected') {
+      rejectedApplications++;
+    }
+  }
 
   // Data for charts
   const statusData = [
@@ -53,20 +62,24 @@ const Analytics = () => {
   const monthlyData = (() => {
     const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
     const now = new Date();
-    return Array.from({ length: 6 }, (_, i) => {
+    const buckets = Array.from({ length: 6 }, (_, i) => {
       const d = new Date(now.getFullYear(), now.getMonth() - 5 + i, 1);
-      const monthApps = applications.filter(app => {
-        if (!app.createdAt) return false;
-        const ad = new Date(app.createdAt);
-        return ad.getFullYear() === d.getFullYear() && ad.getMonth() === d.getMonth();
-      });
-      return {
-        name: months[d.getMonth()],
-        applications: monthApps.length,
-        approved: monthApps.filter(a => a.status === 'approved').length,
-        rejected: monthApps.filter(a => a.status === 'rejected').length,
-      };
+      return { name: months[d.getMonth()], applications: 0, approved: 0, rejected: 0 };
     });
+
+    // Count each application into its month bucket
+    for (const app of applications) {
+      if (!app.createdAt) continue;
+      const ad = new Date(app.createdAt);
+      const offset = (ad.getFullYear() - now.getFullYear()) * 12 + ad.getMonth() - now.getMonth() + 5;
+      const bucket = buckets[offset];
+      if (!bucket) continue;
+      bucket.applications++;
+      if (app.status === 'approved') bucket.approved++;
+      else if (app.status === 'rejected') bucket.rejected++;
+    }
+
+    return buckets;
   })();
 
   // Business type distribution
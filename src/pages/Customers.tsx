@@ -1,6 +1,6 @@
 
 import { useState } from 'react';
-import { useApplications } from '@/contexts/ApplicationContext';
+import { useApplications, LoanApplication } from '@/contexts/ApplicationContext';
 import { useAuth } from '@/contexts/AuthContext';
 import {
   Table,
@@ -24,6 +24,15 @@ import { Button } from '@/components/ui/button';
 import { motion } from 'framer-motion';
 import { Search, UserCircle, CheckCircle, XCircle, ArrowRightIcon } from 'lucide-react';
 
+type Customer = Pick<
+  LoanApplication,
+  'id' | 'fullName' | 'email' | 'phone' | 'businessName' | 'businessType' | 'creditScore'
+> & {
+  totalApplications: number;
+  approvedApplications: number;
+  rejectedApplications: number;
+};
+
 const Customers = () => {
   const { user } = useAuth();
   const { applications } = useApplications();
@@ -32,43 +41,49 @@ const Customers = () => {
   // Extract unique customers from applications
   // In a real application, this would be a separate table in the database
   const getUniqueCustomers = () => {
-    const uniqueEmails = new Set();
-    return applications
-      .filter(app => {
-        if (uniqueEmails.has(app.email)) {
-          return false;
-        }
-        uniqueEmails.add(app.email);
-        return true;
-      })
-      .map(app => ({
-        id: app.id,
-        fullName: app.fullName,
-        email: app.email,
-        phone: app.phone,
-        businessName: app.businessName,
-        businessType: app.businessType,
-        totalApplications: applications.filter(a => a.email === app.email).length,
-        approvedApplications: applications.filter(a => a.email === app.email && a.status === 'approved').length,
-        rejectedApplications: applications.filter(a => a.email === app.email && a.status === 'rejected').length,
-        creditScore: app.creditScore,
-      }));
+    // Customers keyed by email, with application counts accumulated in one pass
+    const customersByEmail = new Map<string, Customer>();
+
+    for (const app of applications) {
+      let customer = customersByEmail.get(app.email);
+      if (!customer) {
+        customer = {
+          id: app.id,
+          fullName: app.fullName,
+          email: app.email,
+          phone: app.phone,
+          businessName: app.businessName,
+          businessType: app.businessType,
+          totalApplications: 0,
+          approvedApplications: 0,
+          rejectedApplications: 0,
+          creditScore: app.creditScore,
+        };
+        customersByEmail.set(app.email, customer);
+      }
+
+      customer.totalApplications++;
+      if (app.status === 'approved') customer.approvedApplications++;
+      else if (app.status === 'rejected') customer.rejectedApplications++;
+    }
+
+    return [...customersByEmail.values()];
   };
 
   const customers = getUniqueCustomers();
 
-  // Filter customers based on search query
-  const filteredCustomers = customers.filter(customer => {
-    if (!searchQuery) return true;
-
-    const query = searchQuery.toLowerCase();
-    return (
-      customer.fullName.toLowerCase().includes(query) ||
-      customer.email.toLowerCase().includes(query) ||
-      customer.businessName.toLowerCase().includes(query) ||
-      customer.businessType.toLowerCase().includes(query)
-    );
-  });
+  // Filter customers with an escaped, case-insensitive query pattern
+  const queryPattern = searchQuery
+    ? new RegExp(searchQuery.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'), 'i')
+    : null;
+  const filteredCustomers = queryPattern
+    ? customers.filter(customer =>
+      queryPattern.test(customer.fullName) ||
+      queryPattern.test(customer.email) ||
+      queryPattern.test(customer.businessName) ||
+      queryPattern.test(customer.businessType)
+    )
+    : customers;
 
   return (
     <div className="space-y-8 max-w-7xl mx-auto">
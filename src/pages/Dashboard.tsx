@@ -45,23 +45,24 @@ const Dashboard = () => {
   const loanPerformanceData = (() => {
     const months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
     const now = new Date();
-    const last6Months = Array.from({ length: 6 }, (_, i) => {
-      const d = new Date(now.getFullYear(), now.getMonth() - 5 + i, 1);
-      return { month: months[d.getMonth()], year: d.getFullYear(), key: `${d.getFullYear()}-${d.getMonth()}` };
-    });
-    return last6Months.map(({ month, year, key }) => {
-      const [y, m] = key.split('-').map(Number);
-      const monthApps = applications.filter(app => {
-        if (!app.createdAt) return false;
-        const d = new Date(app.createdAt);
-        return d.getFullYear() === y && d.getMonth() === m;
-      });
-      return {
-        name: month,
-        approved: monthApps.filter(a => a.status === 'approved').length,
-        rejected: monthApps.filter(a => a.status === 'rejected').length,
-      };
-    });
+    // Bucket by year*12+month
+    const firstMonthKey = now.getFullYear() * 12 + now.getMonth() - 5;
+    const buckets = Array.from({ length: 6 }, (_, i) => ({
+      name: months[(firstMonthKey + i) % 12],
+      approved: 0,
+      rejected: 0,
+    }));
+
+    for (const app of applications) {
+      if (!app.createdAt) continue;
+      const d = new Date(app.createdAt);
+      const bucket = buckets[d.getFullYear() * 12 + d.getMonth() - firstMonthKey];
+      if (!bucket) continue;
+      if (app.status === 'approved') bucket.approved++;
+      else if (app.status === 'rejected') bucket.rejected++;
+    }
+
+    return buckets;
   })();
 
   const chartConfig = {
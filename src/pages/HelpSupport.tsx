@@ -21,6 +21,37 @@ import {
 } from 'lucide-react';
 import { toast } from '@/hooks/use-toast';
 
+const FAQ_ITEMS = [
+  {
+    question: "How do I review a loan application?",
+    answer: "Navigate to the Applications page from the dashboard, select the application you want to review, and click 'Review Application'. You'll be able to see all applicant details, risk assessment, and make approval decisions."
+  },
+  {
+    question: "What do the risk scores mean?",
+    answer: "Risk scores range from 0-100. Scores 80+ are low risk (green), 60-79 are medium risk (yellow), and below 60 are high risk (red). These scores are calculated based on credit history, business financials, and other factors."
+  },
+  {
+    question: "How can I filter applications by status?",
+    answer: "On the Applications page, use the tabs at the top to filter by Pending, Approved, or Rejected status. You can also use the search bar to find specific applications by business name or application ID."
+  },
+  {
+    question: "Can I modify risk thresholds?",
+    answer: "Yes, you can adjust risk thresholds in the Settings page under System preferences. However, changes may require administrator approval depending on your permission level."
+  },
+  {
+    question: "How do I generate reports?",
+    answer: "Visit the Analytics page to access various reports including loan performance, risk analysis, and portfolio metrics. You can export reports as PDF or CSV files."
+  },
+  {
+    question: "What should I do if I encounter technical issues?",
+    answer: "First, try refreshing the page or logging out and back in. If the issue persists, submit a support ticket using the form below or contact our technical support team directly."
+  }
+].map(item => ({
+  ...item,
+  // Lowercased once at load so each keystroke only runs the substring checks
+  searchText: `${item.question}\n${item.answer}`.toLowerCase()
+}));
+
 const HelpSupport = () => {
   const { user } = useAuth();
   const [searchQuery, setSearchQuery] = useState('');
@@ -32,37 +63,8 @@ const HelpSupport = () => {
     });
   };
 
-  const faqItems = [
-    {
-      question: "How do I review a loan application?",
-      answer: "Navigate to the Applications page from the dashboard, select the application you want to review, and click 'Review Application'. You'll be able to see all applicant details, risk assessment, and make approval decisions."
-    },
-    {
-      question: "What do the risk scores mean?",
-      answer: "Risk scores range from 0-100. Scores 80+ are low risk (green), 60-79 are medium risk (yellow), and below 60 are high risk (red). These scores are calculated based on credit history, business financials, and other factors."
-    },
-    {
-      question: "How can I filter applications by status?",
-      answer: "On the Applications page, use the tabs at the top to filter by Pending, Approved, or Rejected status. You can also use the search bar to find specific applications by business name or application ID."
-    },
-    {
-      question: "Can I modify risk thresholds?",
-      answer: "Yes, you can adjust risk thresholds in the Settings page under System preferences. However, changes may require administrator approval depending on your permission level."
-    },
-    {
-      question: "How do I generate reports?",
-      answer: "Visit the Analytics page to access various reports including loan performance, risk analysis, and portfolio metrics. You can export reports as PDF or CSV files."
-    },
-    {
-      question: "What should I do if I encounter technical issues?",
-      answer: "First, try refreshing the page or logging out and back in. If the issue persists, submit a support ticket using the form below or contact our technical support team directly."
-    }
-  ];
-
-  const filteredFAQs = faqItems.filter(item =>
-    item.question.toLowerCase().includes(searchQuery.toLowerCase()) ||
-    item.answer.toLowerCase().includes(searchQuery.toLowerCase())
-  );
+  const query = searchQuery.toLowerCase();
+  const filteredFAQs = FAQ_ITEMS.filter(item => item.searchText.includes(query));
 
   return (
     <div className="space-y-8 max-w-7xl mx-auto">
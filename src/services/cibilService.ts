@@ -1,5 +1,6 @@
 import { httpsCallable } from "firebase/functions";
 import { functions } from "@/lib/firebase";
+import { MAX_EXTRACTION_FILE_SIZE_BYTES } from "@/types/DocumentTypes";
 
 // ────────────────────────────────────────────────────
 // Types matching the Cloud Function response
@@ -81,7 +82,7 @@ const fileToBase64 = (file: File): Promise<string> => {
         reader.onload = () => {
             const result = reader.result as string;
             // Remove the data URL prefix (e.g., "data:application/pdf;base64,")
-            const base64 = result.split(",")[1];
+            const base64 = result.slice(result.indexOf(",") + 1);
             resolve(base64);
         };
         reader.onerror = reject;
@@ -96,6 +97,10 @@ const fileToBase64 = (file: File): Promise<string> => {
 export const extractCibilReport = async (
     file: File
 ): Promise<ExtractedCibilData> => {
+    if (file.size > MAX_EXTRACTION_FILE_SIZE_BYTES) {
+        throw new Error(`File too large (${(file.size / 1024 / 1024).toFixed(1)}MB). Maximum is ${MAX_EXTRACTION_FILE_SIZE_BYTES / (1024 * 1024)}MB.`);
+    }
+
     // Convert file to base64
     const fileBase64 = await fileToBase64(file);
     const mimeType = file.type || "application/pdf";
@@ -1,5 +1,6 @@
 import { httpsCallable } from "firebase/functions";
 import { functions } from "@/lib/firebase";
+import { MAX_EXTRACTION_FILE_SIZE_BYTES } from "@/types/DocumentTypes";
 
 // Document types matching the Cloud Function
 export type MsmeDocumentType =
@@ -157,7 +158,7 @@ const fileToBase64 = (file: File): Promise<string> =>
         reader.onload = () => {
             const result = reader.result as string;
             // Strip data URL prefix (e.g. "data:application/pdf;base64,")
-            const base64 = result.split(",")[1];
+            const base64 = result.slice(result.indexOf(",") + 1);
             resolve(base64);
         };
         reader.onerror = reject;
@@ -172,6 +173,10 @@ export const extractMsmeDocument = async (
     file: File,
     documentType: MsmeDocumentType
 ): Promise<MsmeExtractionResult> => {
+    if (file.size > MAX_EXTRACTION_FILE_SIZE_BYTES) {
+        throw new Error(`File too large (${(file.size / 1024 / 1024).toFixed(1)}MB). Maximum is ${MAX_EXTRACTION_FILE_SIZE_BYTES / (1024 * 1024)}MB.`);
+    }
+
     const fileBase64 = await fileToBase64(file);
 
     const fn = httpsCallable<
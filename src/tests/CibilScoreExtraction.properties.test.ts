@@ -0,0 +1,43 @@
+import { describe, it, expect } from 'vitest';
+import * as fc from 'fast-check';
+import { FinancialDataExtractor } from '../utils/financialDataExtractor';
+
+const cibilScore = (text: string) =>
+    new FinancialDataExtractor(text).extractAll().cibilScore;
+
+const validScore = fc.integer({ min: 300, max: 900 });
+const outOfRangeScore = fc.oneof(fc.integer({ min: 100, max: 299 }), fc.integer({ min: 901, max: 999 }));
+
+describe('CIBIL Score Extraction Properties', () => {
+
+    it('should extract any score in the 300-900 range', () => {
+        fc.assert(
+            fc.property(validScore, (score) => {
+                expect(cibilScore(`CIBIL Score: ${score}`)).toBe(String(score));
+            })
+        );
+    });
+
+    it('should skip an out-of-range score and return the next valid one', () => {
+        fc.assert(
+            fc.property(outOfRangeScore, validScore, (invalid, score) => {
+                expect(cibilScore(`CIBIL Score: ${invalid}\nCIBIL Score: ${score}`)).toBe(String(score));
+            })
+        );
+    });
+
+    it('should skip out-of-range scores in report text', () => {
+        expect(cibilScore('CIBIL Score: 950\nCIBIL Score: 742')).toBe('742');
+        expect(cibilScore('Score: 250 (old model)\nCredit Score: 781')).toBe('781');
+    });
+
+    it('should return empty when the only score is out of range', () => {
+        expect(cibilScore('CIBIL Score: 950')).toBe('');
+    });
+
+    it('should accept the range bounds', () => {
+        expect(cibilScore('CIBIL Score: 300')).toBe('300');
+        expect(cibilScore('CIBIL Score: 900')).toBe('900');
+    });
+
+});
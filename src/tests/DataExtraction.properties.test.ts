@@ -90,4 +90,48 @@ describe('Financial Data Extraction Properties', () => {
         expect((result.data as any).monthlyTurnover).toBe('₹50,00,000');
     });
 
+    // Labels that share a value tail are matched by one alternation, so when
+    // a document uses two different labels the leftmost one wins
+    it('should take the leftmost label when a document uses two asset/liability labels', () => {
+        const result = extractMsmeDocument({
+            type: 'balance_sheet',
+            extractedText: 'Assets Total: ₹2,00,000\nTotal Assets: ₹5,00,000\nLiabilities Total: ₹80,000\nTotal Liabilities: ₹90,000',
+            fileName: 'bs.pdf'
+        });
+        expect((result.data as any).totalAssets).toBe('₹2,00,000');
+        expect((result.data as any).totalLiabilities).toBe('₹80,000');
+
+        const swapped = extractMsmeDocument({
+            type: 'balance_sheet',
+            extractedText: 'Total Assets: ₹5,00,000\nAssets Total: ₹2,00,000',
+            fileName: 'bs.pdf'
+        });
+        expect((swapped.data as any).totalAssets).toBe('₹5,00,000');
+    });
+
+    it('should take the leftmost account number label', () => {
+        const result = extractMsmeDocument({
+            type: 'bank_statement',
+            extractedText: 'Account Number: 123456789012\nA/C No: 987654321098',
+            fileName: 'bank.pdf'
+        });
+        expect((result.data as any).accountNumber).toBe('123456789012');
+
+        const swapped = extractMsmeDocument({
+            type: 'bank_statement',
+            extractedText: 'A/C No: 987654321098\nAccount Number: 123456789012',
+            fileName: 'bank.pdf'
+        });
+        expect((swapped.data as any).accountNumber).toBe('987654321098');
+    });
+
+    it('should take the leftmost GST number label', () => {
+        const result = extractMsmeDocument({
+            type: 'gst_returns',
+            extractedText: 'GST No: 29ABCDE1234F1Z5\nGSTIN: 27AABCU9603R1ZN',
+            fileName: 'gst.pdf'
+        });
+        expect((result.data as any).gstNumber).toBe('29ABCDE1234F1Z5');
+    });
+
 });
@@ -0,0 +1,58 @@
+import { describe, it, expect } from 'vitest';
+import * as fc from 'fast-check';
+import { extractKeyInformation } from '../utils/keyInformation';
+
+describe('Key Information Extraction Properties', () => {
+
+    it('should list each amount once in first-seen order', () => {
+        fc.assert(
+            fc.property(fc.array(fc.integer({ min: 1, max: 99999 }), { maxLength: 20 }), (values) => {
+                const text = values.map(value => `paid $${value}`).join(' and ');
+                expect(extractKeyInformation(text).amounts).toEqual([...new Set(values.map(value => `$${value}`))]);
+            })
+        );
+    });
+
+    it('should sort every category out of one document', () => {
+        const text = 'Contact John Smith at john.smith@example.com or (555) 123-4567 by 12/05/2024 for $1,250.00';
+        expect(extractKeyInformation(text)).toEqual({
+            emails: ['john.smith@example.com'],
+            phones: [' (555) 123-4567'],
+            dates: ['12/05/2024'],
+            amounts: ['$1,250.00'],
+            names: ['Contact John']
+        });
+    });
+
+    // Overlapping matches resolve leftmost-first, so each span lands in one bucket
+
+    it('should not report the digits of an amount as a phone number', () => {
+        const info = extractKeyInformation('Pay $5551234567 now');
+        expect(info.amounts).toEqual(['$5551234567']);
+        expect(info.phones).toEqual([]);
+    });
+
+    it('should not take a phone number from the local part of an email', () => {
+        const info = extractKeyInformation('Mail 5551234567@bank.com');
+        expect(info.emails).toEqual(['5551234567@bank.com']);
+        expect(info.phones).toEqual([]);
+    });
+
+    it('should still report a phone number next to an email or date', () => {
+        expect(extractKeyInformation('Mail 5551234567 or ops@bank.com')).toMatchObject({
+            emails: ['ops@bank.com'],
+            phones: [' 5551234567']
+        });
+        expect(extractKeyInformation('Due 2024-01-15 ref 555.123.4567')).toMatchObject({
+            dates: ['2024-01-15'],
+            phones: [' 555.123.4567']
+        });
+        expect(extractKeyInformation('Ref +1 555 123 4567@home').phones).toEqual(['+1 555 123 4567']);
+    });
+
+    it('should keep at most ten names', () => {
+        const text = Array.from({ length: 12 }, (_, i) => `Name${String.fromCharCode(97 + i)} Person`).join(', ');
+        expect(extractKeyInformation(text).names).toHaveLength(10);
+    });
+
+});
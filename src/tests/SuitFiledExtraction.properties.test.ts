@@ -0,0 +1,101 @@
+import { describe, it, expect } from 'vitest';
+import * as fc from 'fast-check';
+import { FinancialDataExtractor } from '../utils/financialDataExtractor';
+
+const suitFiledAndDefault = (text: string) =>
+    new FinancialDataExtractor(text).extractAll().suitFiledAndDefault;
+
+// Reference: the straightforward per-indicator loop that the fused indicator
+// scan replaced. Indicators are tried in priority order; the first one present
+// decides the result.
+const REFERENCE_INDICATORS = [
+    'suit\\s*filed', 'legal\\s*action', 'court\\s*case', 'litigation', 'default', 'npa', 'non[\\s-]?performing'
+];
+const AMOUNT = '(?:rs\\.?\\s*|₹\\s*)?([₹\\d,]+(?:\\.\\d{2})?)';
+
+const formatReferenceAmount = (raw: string | undefined): string => {
+    if (!raw) return '';
+    const amount = raw.replace(/[₹,]/g, '').trim();
+    const num = parseFloat(amount);
+    if (!amount || isNaN(num)) return '';
+    if (num >= 10000000) return `₹${(num / 10000000).toFixed(2)} Cr`;
+    if (num >= 100000) return `₹${(num / 100000).toFixed(2)} L`;
+    if (num >= 1000) return `₹${(num / 1000).toFixed(2)} K`;
+    return `₹${num.toLocaleString()}`;
+};
+
+const referenceSuitFiledAndDefault = (input: string): string => {
+    const text = input.toLowerCase();
+    for (const indicator of REFERENCE_INDICATORS) {
+        const match = new RegExp(indicator).exec(text);
+        if (match) {
+            const amountAfter = new RegExp(indicator + '.*?' + AMOUNT, 'g');
+            amountAfter.lastIndex = match.index;
+            const amountBefore = new RegExp(AMOUNT + '.*?' + indicator);
+            return formatReferenceAmount(amountAfter.exec(text)?.[1])
+                || formatReferenceAmount(text.match(amountBefore)?.[1])
+                || 'Yes';
+        }
+    }
+    return '';
+};
+
+// Short report fragments mixing every indicator with amounts, currency
+// markers and line breaks in arbitrary order
+const reportText = fc
+    .array(
+        fc.constantFrom(
+            'Suit Filed', 'suit filed', 'Legal Action', 'court case', 'Litigation', 'DEFAULT', 'NPA',
+            'non-performing', 'Non Performing', 'Rs.', 'rs ', '₹', '1,234', '50000', '.50', '99',
+            ' ', ': ', '\n', 'amount', 'status'
+        ),
+        { maxLength: 20 }
+    )
+    .map(parts => parts.join(''));
+
+describe('Suit Filed / Default Extraction Properties', () => {
+
+    it('should match the per-indicator reference on arbitrary report text', () => {
+        fc.assert(
+            fc.property(reportText, (text) => {
+                expect(suitFiledAndDefault(text)).toBe(referenceSuitFiledAndDefault(text));
+            })
+        );
+    });
+
+    it('should prefer suit filed over indicators that appear earlier in the text', () => {
+        const text = 'Account marked default for Rs 2,00,000. Suit filed: Rs 50,000';
+        expect(suitFiledAndDefault(text)).toBe('₹50.00 K');
+    });
+
+    it('should fall back to lower priority indicators in order', () => {
+        expect(suitFiledAndDefault('NPA tagged. Court case claim ₹3,00,000')).toBe('₹3.00 L');
+        expect(suitFiledAndDefault('Classified as non-performing: 12,50,00,000')).toBe('₹12.50 Cr');
+    });
+
+    it('should take the amount following the indicator', () => {
+        expect(suitFiledAndDefault('Legal action initiated for ₹1,50,000 in 2022')).toBe('₹1.50 L');
+    });
+
+    it('should take the amount preceding the indicator when none follows it', () => {
+        expect(suitFiledAndDefault('₹75,000 outstanding due to litigation')).toBe('₹75.00 K');
+        expect(suitFiledAndDefault('Rs. 4,50,000.50 written as default')).toBe('₹4.50 L');
+    });
+
+    // Without the atomic amount capture this input backtracks over every split
+    // of the digit run and takes tens of seconds; it must finish well within
+    // the test timeout
+    it('should not backtrack over long digit runs on a line without the indicator', () => {
+        const text = '1'.repeat(3000) + ' x'.repeat(2000) + '\ndefault';
+        expect(suitFiledAndDefault(text)).toBe('Yes');
+    }, 2000);
+
+    it('should report Yes when an indicator has no amount nearby', () => {
+        expect(suitFiledAndDefault('Litigation status: pending')).toBe('Yes');
+    });
+
+    it('should return empty when no indicator is present', () => {
+        expect(suitFiledAndDefault('All accounts regular. Outstanding Rs 10,000')).toBe('');
+    });
+
+});
@@ -0,0 +1,55 @@
+import { describe, it, expect } from 'vitest';
+import * as fc from 'fast-check';
+import { getTextStats } from '../utils/textStats';
+
+// Reference counts: the split/filter implementation getTextStats replaced
+const referenceStats = (text: string) => ({
+    characters: text.length,
+    words: text.split(/\s+/).filter(word => word.length > 0).length,
+    sentences: text.split(/[.!?]+/).filter(sentence => sentence.trim().length > 0).length,
+    paragraphs: text.split(/\n\s*\n/).filter(para => para.trim().length > 0).length
+});
+
+// Text built mostly from the characters the patterns care about, so runs of
+// terminators, blank lines and mixed whitespace come up often
+const documentText = fc
+    .array(
+        fc.constantFrom('a', 'Word', '12', ' ', '  ', '\t', '\n', '\r\n', '\n\n', '.', '!', '?', '...', ' ', '﻿'),
+        { maxLength: 60 }
+    )
+    .map(parts => parts.join(''));
+
+describe('Text Statistics Properties', () => {
+
+    it('should match split-based counts for document-like text', () => {
+        fc.assert(
+            fc.property(documentText, (text) => {
+                expect(getTextStats(text)).toEqual(referenceStats(text));
+            })
+        );
+    });
+
+    it('should match split-based counts for arbitrary strings', () => {
+        fc.assert(
+            fc.property(fc.string({ maxLength: 80 }), (text) => {
+                expect(getTextStats(text)).toEqual(referenceStats(text));
+            })
+        );
+    });
+
+    it('should count paragraphs separated by whitespace-only lines', () => {
+        const text = 'First para line one\nline two.\n  \t\nSecond para!\n\n\n\nThird?';
+        expect(getTextStats(text)).toEqual({
+            characters: text.length,
+            words: 9,
+            sentences: 3,
+            paragraphs: 3
+        });
+    });
+
+    it('should report zero counts for empty or blank text', () => {
+        expect(getTextStats('')).toEqual({ characters: 0, words: 0, sentences: 0, paragraphs: 0 });
+        expect(getTextStats(' \n\n\t ')).toEqual({ characters: 5, words: 0, sentences: 0, paragraphs: 0 });
+    });
+
+});
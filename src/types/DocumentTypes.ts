@@ -36,3 +36,7 @@ export const ALLOWED_FILE_TYPES: Record<DocumentType, string[]> = {
 };
 
 export const MAX_FILE_SIZE_BYTES = 50 * 1024 * 1024; // 50MB
+
+// Cloud Function extraction limit; checked client-side before the file is read
+// and base64-encoded in memory
+export const MAX_EXTRACTION_FILE_SIZE_BYTES = 15 * 1024 * 1024; // 15MB
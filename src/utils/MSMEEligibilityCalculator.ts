@@ -349,6 +349,10 @@ export const calculateEligibility = (input: EligibilityInput): EligibilityResult
         else rejectionReason = 'Make Stronger Case: Overall risk score below threshold (60)';
     }
 
+    // Look each document up once and reuse it for the reported metrics
+    const gstData = docs.find(d => d.documentType === 'gst_returns')?.data as any;
+    const bankData = docs.find(d => d.documentType === 'bank_statement')?.data as any;
+
     return {
         overallScore: Math.round(overallScore),
         isEligible,
@@ -367,8 +371,8 @@ export const calculateEligibility = (input: EligibilityInput): EligibilityResult
             dscr: Math.round(dscr * 100) / 100,
             currentRatio: currentRatio ? Math.round(currentRatio * 100) / 100 : undefined,
             revenueGrowth: revenueGrowth ? Math.round(revenueGrowth * 100) / 100 : undefined,
-            gstCompliance: docs.find(d => d.documentType === 'gst_returns')?.data && (docs.find(d => d.documentType === 'gst_returns')?.data as any).filingRegularity || 'N/A',
-            bankingRelationship: docs.find(d => d.documentType === 'bank_statement')?.data && (docs.find(d => d.documentType === 'bank_statement')?.data as any).cashFlowPattern || 'N/A',
+            gstCompliance: gstData?.filingRegularity || 'N/A',
+            bankingRelationship: bankData?.cashFlowPattern || 'N/A',
         },
     };
 };
@@ -11,6 +11,118 @@ export interface FinancialData {
     accountNumbers: string[];
 }
 
+// Patterns shared by every extractor instance. They run against the
+// lowercased report text, so they are written in lower case without `i`.
+
+// Captures only 300-900; an out-of-range score is skipped for a later valid one
+const CIBIL_SCORE_PATTERNS = [
+    /cibil\s*score\s*:?\s*([3-8]\d{2}|900)/,
+    /credit\s*score\s*:?\s*([3-8]\d{2}|900)/,
+    /score\s*:?\s*([3-8]\d{2}|900)/,
+    /([3-8]\d{2}|900)\s*cibil/,
+    /([3-8]\d{2}|900)\s*score/
+];
+
+// Literal keywords at least one of which every pattern in the matching group
+// requires. A plain substring probe on the lowercased text is far cheaper than
+// running a whole group of regexes that are bound to miss.
+const CIBIL_SCORE_KEYWORDS = ['score', 'cibil'];
+const NUMBER_OF_LOANS_KEYWORDS = ['loan', 'account'];
+const TOTAL_LOAN_AMOUNT_KEYWORDS = ['amount'];
+const AMOUNT_OVERDUE_KEYWORDS = ['overdue', 'outstanding', 'dues', 'arrears'];
+const SETTLED_KEYWORDS = ['settle', 'writ', 'closed'];
+
+const NUMBER_OF_LOANS_PATTERNS = [
+    /(\d+)\s*(?:active\s*)?(?:loan|account)s?/,
+    /(?:loan|account)s?\s*:?\s*(\d+)/,
+    /total\s*(?:loan|account)s?\s*:?\s*(\d+)/,
+    /number\s*of\s*(?:loan|account)s?\s*:?\s*(\d+)/
+];
+
+const TOTAL_LOAN_AMOUNT_PATTERNS = [
+    /total\s*(?:loan\s*)?amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /(?:loan\s*)?amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /sanctioned\s*amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /principal\s*amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/
+];
+
+const AMOUNT_OVERDUE_PATTERNS = [
+    /(?:amount\s*)?overdue\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /overdue\s*amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /outstanding\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /dues\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /arrears\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/
+];
+
+// Each suit/default indicator carries its own pair of "amount near keyword"
+// patterns so they don't have to be rebuilt with `new RegExp` per call.
+// `amountAfter` is global so it can resume from the keyword match position.
+// In `amountBefore` the amount is captured inside a lookahead and consumed by
+// backreference, which makes it atomic: JS has no possessive quantifiers, and
+// otherwise every shorter split of a long digit run is retried against the
+// rest of the line. Indicators never start with a digit, so giving those
+// splits up cannot lose a match.
+const SUIT_INDICATORS = [
+    /suit\s*filed/,
+    /legal\s*action/,
+    /court\s*case/,
+    /litigation/,
+    /default/,
+    /npa/,
+    /non[\s-]?performing/
+];
+
+const SUIT_PATTERNS = SUIT_INDICATORS.map(pattern => ({
+    amountAfter: new RegExp(pattern.source + '.*?(?:rs\\.?\\s*|₹\\s*)?([₹\\d,]+(?:\\.\\d{2})?)', 'g'),
+    amountBefore: new RegExp('(?:rs\\.?\\s*|₹\\s*)?(?=([₹\\d,]+(?:\\.\\d{2})?))\\1.*?' + pattern.source)
+}));
+
+// Every suit indicator fused into one global scan, with a capture group per
+// indicator. Wrapping the alternation in a lookahead keeps matches zero-width,
+// so one indicator can never consume text that hides another's occurrence.
+const SUIT_INDICATOR_SCAN = new RegExp(`(?=${SUIT_INDICATORS.map(p => `(${p.source})`).join('|')})`, 'g');
+
+const SETTLED_AMOUNT_PATTERNS = [
+    /(?:settled|written\s*off)\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /settlement\s*amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /write[\s-]?off\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/,
+    /closed\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/
+];
+
+const SETTLED_STATUS_PATTERN = /settled|written\s*off|write[\s-]?off|closed/;
+
+const REPORT_DATE_PATTERNS = [
+    /(?:report\s*)?date\s*:?\s*(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})/,
+    /(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})/,
+    /(?:generated\s*on|as\s*on)\s*:?\s*(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})/
+];
+
+const APPLICANT_NAME_PATTERNS = [
+    /(?:name|applicant)\s*:?\s*([a-z\s]{2,50})/,
+    /mr\.?\s*([a-z\s]{2,50})/,
+    /ms\.?\s*([a-z\s]{2,50})/,
+    /([a-z]+\s+[a-z]+(?:\s+[a-z]+)?)/ // Basic name pattern
+];
+
+const PAN_NUMBER_PATTERN = /([a-z]{5}\d{4}[a-z])/;
+
+const ACCOUNT_NUMBER_PATTERNS = [
+    /(?:account|a\/c)\s*(?:no\.?|number)\s*:?\s*([a-z0-9]{8,20})/g,
+    /([0-9]{10,16})/g // Generic number pattern for account numbers
+];
+
+const MAX_ACCOUNT_NUMBERS = 5;
+
+const AMOUNT_NOISE_PATTERN = /[₹,]/g;
+const WORD_PATTERN = /\w\S*/g;
+
+const COMMON_WORDS = new Set([
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'between', 'among', 'report', 'date', 'amount', 'loan', 'account',
+    'cibil', 'score', 'total', 'number', 'overdue', 'settled', 'written', 'off'
+]);
+
 export class FinancialDataExtractor {
     private text: string;
 
@@ -35,21 +147,11 @@ export class FinancialDataExtractor {
 
     private extractCibilScore(): string {
         // Look for CIBIL score patterns
-        const patterns = [
-            /cibil\s*score\s*:?\s*(\d{3})/i,
-            /credit\s*score\s*:?\s*(\d{3})/i,
-            /score\s*:?\s*(\d{3})/i,
-            /(\d{3})\s*cibil/i,
-            /(\d{3})\s*score/i
-        ];
-
-        for (const pattern of patterns) {
+        if (!this.mentionsAny(CIBIL_SCORE_KEYWORDS)) return '';
+        for (const pattern of CIBIL_SCORE_PATTERNS) {
             const match = this.text.match(pattern);
             if (match && match[1]) {
-                const score = parseInt(match[1]);
-                if (score >= 300 && score <= 900) {
-                    return match[1];
-                }
+                return match[1];
             }
         }
         return '';
@@ -57,14 +159,8 @@ export class FinancialDataExtractor {
 
     private extractNumberOfLoans(): string {
         // Look for number of loans/accounts
-        const patterns = [
-            /(\d+)\s*(?:active\s*)?(?:loan|account)s?/i,
-            /(?:loan|account)s?\s*:?\s*(\d+)/i,
-            /total\s*(?:loan|account)s?\s*:?\s*(\d+)/i,
-            /number\s*of\s*(?:loan|account)s?\s*:?\s*(\d+)/i
-        ];
-
-        for (const pattern of patterns) {
+        if (!this.mentionsAny(NUMBER_OF_LOANS_KEYWORDS)) return '';
+        for (const pattern of NUMBER_OF_LOANS_PATTERNS) {
             const match = this.text.match(pattern);
             if (match && match[1]) {
                 const count = parseInt(match[1]);
@@ -78,95 +174,51 @@ export class FinancialDataExtractor {
 
     private extractTotalLoanAmount(): string {
         // Look for total loan amounts
-        const patterns = [
-            /total\s*(?:loan\s*)?amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /(?:loan\s*)?amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /sanctioned\s*amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /principal\s*amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i
-        ];
-
-        return this.extractAmount(patterns);
+        if (!this.mentionsAny(TOTAL_LOAN_AMOUNT_KEYWORDS)) return '';
+        return this.extractAmount(TOTAL_LOAN_AMOUNT_PATTERNS);
     }
 
     private extractAmountOverdue(): string {
         // Look for overdue amounts
-        const patterns = [
-            /(?:amount\s*)?overdue\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /overdue\s*amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /outstanding\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /dues\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /arrears\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i
-        ];
-
-        return this.extractAmount(patterns);
+        if (!this.mentionsAny(AMOUNT_OVERDUE_KEYWORDS)) return '';
+        return this.extractAmount(AMOUNT_OVERDUE_PATTERNS);
     }
 
     private extractSuitFiledAndDefault(): string {
-        // Look for suit filed or default information
-        const suitPatterns = [
-            /suit\s*filed/i,
-            /legal\s*action/i,
-            /court\s*case/i,
-            /litigation/i,
-            /default/i,
-            /npa/i,
-            /non[\s-]?performing/i
-        ];
-
-        for (const pattern of suitPatterns) {
-            if (this.text.match(pattern)) {
-                // Try to extract associated amount
-                const amountPatterns = [
-                    new RegExp(pattern.source + '.*?(?:rs\\.?\\s*|₹\\s*)?([₹\\d,]+(?:\\.\\d{2})?)', 'i'),
-                    new RegExp('(?:rs\\.?\\s*|₹\\s*)?([₹\\d,]+(?:\\.\\d{2})?).*?' + pattern.source, 'i')
-                ];
-
-                const amount = this.extractAmount(amountPatterns);
-                if (amount) return amount;
-
-                return 'Yes'; // Found indication but no amount
-            }
+        // Look for suit filed or default information; first index per indicator
+        const firstIndex: number[] = [];
+        for (const match of this.text.matchAll(SUIT_INDICATOR_SCAN)) {
+            const indicator = match.findIndex((group, i) => i > 0 && group !== undefined) - 1;
+            if (firstIndex[indicator] === undefined) firstIndex[indicator] = match.index!;
+            if (indicator === 0) break; // Highest priority indicator found
         }
-        return '';
+
+        const indicator = firstIndex.findIndex(index => index !== undefined);
+        if (indicator === -1) return '';
+
+        // Try to extract associated amount, starting at the indicator
+        const { amountAfter, amountBefore } = SUIT_PATTERNS[indicator];
+        amountAfter.lastIndex = firstIndex[indicator];
+        const amount = this.cleanAmount(amountAfter.exec(this.text))
+            || this.extractAmount([amountBefore]);
+        if (amount) return amount;
+
+        return 'Yes'; // Found indication but no amount
     }
 
     private extractSettledAndWrittenOff(): string {
         // Look for settled or written off amounts
-        const patterns = [
-            /(?:settled|written\s*off)\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /settlement\s*amount\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /write[\s-]?off\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i,
-            /closed\s*:?\s*(?:rs\.?\s*|₹\s*)?([₹\d,]+(?:\.\d{2})?)/i
-        ];
-
-        const amount = this.extractAmount(patterns);
+        if (!this.mentionsAny(SETTLED_KEYWORDS)) return '';
+        const amount = this.extractAmount(SETTLED_AMOUNT_PATTERNS);
         if (amount) return amount;
 
         // Check for status indicators
-        const statusPatterns = [
-            /settled/i,
-            /written\s*off/i,
-            /write[\s-]?off/i,
-            /closed/i
-        ];
-
-        for (const pattern of statusPatterns) {
-            if (this.text.match(pattern)) {
-                return 'Yes';
-            }
-        }
-        return '';
+        return SETTLED_STATUS_PATTERN.test(this.text) ? 'Yes' : '';
     }
 
     private extractReportDate(): string {
         // Look for report dates
-        const patterns = [
-            /(?:report\s*)?date\s*:?\s*(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})/i,
-            /(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})/i,
-            /(?:generated\s*on|as\s*on)\s*:?\s*(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})/i
-        ];
-
-        for (const pattern of patterns) {
+        for (const pattern of REPORT_DATE_PATTERNS) {
             const match = this.text.match(pattern);
             if (match && match[1]) {
                 return match[1];
@@ -177,14 +229,7 @@ export class FinancialDataExtractor {
 
     private extractApplicantName(): string {
         // Look for applicant name
-        const patterns = [
-            /(?:name|applicant)\s*:?\s*([a-z\s]{2,50})/i,
-            /mr\.?\s*([a-z\s]{2,50})/i,
-            /ms\.?\s*([a-z\s]{2,50})/i,
-            /([a-z]+\s+[a-z]+(?:\s+[a-z]+)?)/i // Basic name pattern
-        ];
-
-        for (const pattern of patterns) {
+        for (const pattern of APPLICANT_NAME_PATTERNS) {
             const match = this.text.match(pattern);
             if (match && match[1]) {
                 const name = match[1].trim();
@@ -199,39 +244,44 @@ export class FinancialDataExtractor {
 
     private extractPanNumber(): string {
         // Look for PAN number
-        const pattern = /([a-z]{5}\d{4}[a-z])/i;
-        const match = this.text.match(pattern);
+        const match = this.text.match(PAN_NUMBER_PATTERN);
         return match ? match[1].toUpperCase() : '';
     }
 
     private extractAccountNumbers(): string[] {
-        // Look for account numbers
-        const patterns = [
-            /(?:account|a\/c)\s*(?:no\.?|number)\s*:?\s*([a-z0-9]{8,20})/gi,
-            /([0-9]{10,16})/g // Generic number pattern for account numbers
-        ];
-
-        const accounts: string[] = [];
-        for (const pattern of patterns) {
+        // Look for account numbers, deduplicated in first-seen order
+        const accounts = new Set<string>();
+        for (const pattern of ACCOUNT_NUMBER_PATTERNS) {
             const matches = this.text.matchAll(pattern);
             for (const match of matches) {
-                if (match[1] && !accounts.includes(match[1])) {
-                    accounts.push(match[1]);
+                if (match[1]) {
+                    accounts.add(match[1]);
+                    // Only the first few are kept, so stop scanning once we have them
+                    if (accounts.size >= MAX_ACCOUNT_NUMBERS) return [...accounts];
                 }
             }
         }
-        return accounts.slice(0, 5); // Limit to 5 accounts
+        return [...accounts];
+    }
+
+    private mentionsAny(keywords: string[]): boolean {
+        return keywords.some(keyword => this.text.includes(keyword));
     }
 
     private extractAmount(patterns: RegExp[]): string {
         for (const pattern of patterns) {
-            const match = this.text.match(pattern);
-            if (match && match[1]) {
-                // Clean up the amount
-                let amount = match[1].replace(/[₹,]/g, '').trim();
-                if (amount && !isNaN(parseFloat(amount))) {
-                    return this.formatAmount(amount);
-                }
+            const amount = this.cleanAmount(this.text.match(pattern));
+            if (amount) return amount;
+        }
+        return '';
+    }
+
+    private cleanAmount(match: RegExpMatchArray | null): string {
+        if (match && match[1]) {
+            // Clean up the amount
+            let amount = match[1].replace(AMOUNT_NOISE_PATTERN, '').trim();
+            if (amount && !isNaN(parseFloat(amount))) {
+                return this.formatAmount(amount);
             }
         }
         return '';
@@ -251,18 +301,24 @@ export class FinancialDataExtractor {
     }
 
     private isCommonWord(word: string): boolean {
-        const commonWords = [
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-            'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after', 'above',
-            'below', 'between', 'among', 'report', 'date', 'amount', 'loan', 'account',
-            'cibil', 'score', 'total', 'number', 'overdue', 'settled', 'written', 'off'
-        ];
-        return commonWords.includes(word.toLowerCase());
+        return COMMON_WORDS.has(word.toLowerCase());
     }
 
     private toTitleCase(str: string): string {
-        return str.replace(/\w\S*/g, (txt) =>
+        return str.replace(WORD_PATTERN, (txt) =>
             txt.charAt(0).toUpperCase() + txt.substr(1).toLowerCase()
         );
     }
-}
\ No newline at end of file
+}
+
+// Result for the most recent document, reused when the same text comes back
+let lastText: string | undefined;
+let lastResult: FinancialData | undefined;
+
+export const extractFinancialData = (text: string): FinancialData => {
+    if (lastResult === undefined || text !== lastText) {
+        lastResult = new FinancialDataExtractor(text).extractAll();
+        lastText = text;
+    }
+    return lastResult;
+};
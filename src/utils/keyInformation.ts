@@ -0,0 +1,50 @@
+// Emails, phone numbers, dates, amounts and names found in extracted document text
+
+export interface KeyInformation {
+  emails: string[];
+  phones: string[];
+  dates: string[];
+  amounts: string[];
+  names: string[];
+}
+
+// One alternation with a named group per category. Where matches overlap the
+// leftmost wins, and a phone number is not taken from an email's local part.
+const KEY_INFORMATION_PATTERN = new RegExp(
+  [
+    /(?<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)/,
+    /(?<amount>\$[\d,]+\.?\d*)/,
+    /(?<date>\b\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4}\b|\b\d{4}[\/\-\.]\d{1,2}[\/\-\.]\d{1,2}\b)/,
+    /(?<phone>(?:\+?1?[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}(?![A-Za-z0-9._%+-]*@[A-Za-z0-9.-]+\.[A-Za-z]{2,}))/,
+    /(?<name>\b[A-Z][a-z]+ [A-Z][a-z]+\b)/ // Capitalized word pairs
+  ].map(pattern => pattern.source).join('|'),
+  'g'
+);
+
+const MAX_NAMES = 10;
+
+export const extractKeyInformation = (text: string): KeyInformation => {
+  // Sets keep first-seen order and drop repeats
+  const emails = new Set<string>();
+  const phones = new Set<string>();
+  const dates = new Set<string>();
+  const amounts = new Set<string>();
+  const names = new Set<string>();
+
+  for (const match of text.matchAll(KEY_INFORMATION_PATTERN)) {
+    const { email, amount, date, phone, name } = match.groups!;
+    if (email) emails.add(email);
+    else if (amount) amounts.add(amount);
+    else if (date) dates.add(date);
+    else if (phone) phones.add(phone);
+    else if (name && names.size < MAX_NAMES) names.add(name);
+  }
+
+  return {
+    emails: [...emails],
+    phones: [...phones],
+    dates: [...dates],
+    amounts: [...amounts],
+    names: [...names]
+  };
+};
@@ -17,6 +17,8 @@ import {
   bankStatementPatterns,
   gstPatterns,
   itrPatterns,
+  periodPatterns,
+  filingRegularityPatterns,
 } from './patterns';
 
 interface ExtractorInput {
@@ -26,10 +28,13 @@ interface ExtractorInput {
   fileName: string;
 }
 
+// Thousands separators stripped from every captured amount
+const THOUSANDS_SEPARATOR_PATTERN = /,/g;
+
 // Helper to format currency values
 const formatCurrency = (value: string | null): string => {
   if (!value) return 'N/A';
-  const num = parseFloat(value.replace(/,/g, ''));
+  const num = parseFloat(value.replace(THOUSANDS_SEPARATOR_PATTERN, ''));
   if (isNaN(num)) return 'N/A';
   return `₹${num.toLocaleString('en-IN')}`;
 };
@@ -39,7 +44,7 @@ const extractFirstMatch = (text: string, patterns: RegExp[]): string | null => {
   for (const pattern of patterns) {
     const match = text.match(pattern);
     if (match && match[1]) {
-      return match[1].replace(/,/g, '');
+      return match[1].replace(THOUSANDS_SEPARATOR_PATTERN, '');
     }
   }
   return null;
@@ -66,13 +71,15 @@ const extractBalanceSheet = (text: string): BalanceSheetData => {
     longTermDebt: formatCurrency(extractFirstMatch(text, balanceSheetPatterns.longTermDebt)),
     netWorth: formatCurrency(extractFirstMatch(text, balanceSheetPatterns.netWorth)),
     workingCapital: formatCurrency(extractFirstMatch(text, balanceSheetPatterns.workingCapital)),
-    fiscalYear: text.match(/(?:fy|fiscal\s+year|year)\s*[:\-]?\s*(20[0-9]{2}[\-\s]?(?:20)?[0-9]{2})/i)?.[1] || 'N/A',
+    fiscalYear: text.match(periodPatterns.fiscalYear)?.[1] || 'N/A',
   };
   return data;
 };
 
 // Extract Profit & Loss data
 const extractProfitLoss = (text: string): ProfitLossData => {
+  const profitMargin = extractFirstMatch(text, profitLossPatterns.profitMargin);
+
   const data = {
     revenue: formatCurrency(extractFirstMatch(text, profitLossPatterns.revenue)),
     costOfGoods: formatCurrency(extractFirstMatch(text, profitLossPatterns.costOfGoods)),
@@ -80,10 +87,8 @@ const extractProfitLoss = (text: string): ProfitLossData => {
     operatingExpenses: formatCurrency(extractFirstMatch(text, profitLossPatterns.operatingExpenses)),
     ebitda: formatCurrency(extractFirstMatch(text, profitLossPatterns.ebitda)),
     netProfit: formatCurrency(extractFirstMatch(text, profitLossPatterns.netProfit)),
-    profitMargin: extractFirstMatch(text, profitLossPatterns.profitMargin)
-      ? `${extractFirstMatch(text, profitLossPatterns.profitMargin)}%`
-      : 'N/A',
-    fiscalYear: text.match(/(?:fy|fiscal\s+year|year)\s*[:\-]?\s*(20[0-9]{2}[\-\s]?(?:20)?[0-9]{2})/i)?.[1] || 'N/A',
+    profitMargin: profitMargin ? `${profitMargin}%` : 'N/A',
+    fiscalYear: text.match(periodPatterns.fiscalYear)?.[1] || 'N/A',
   };
   return data;
 };
@@ -112,7 +117,7 @@ const extractBankStatement = (text: string): BankStatementData => {
     chequeBounces: bounceMatch ? parseInt(bounceMatch) : 0,
     totalCredits: formatCurrency(credits),
     totalDebits: formatCurrency(debits),
-    statementPeriod: text.match(/(?:period|from)\s*[:\-]?\s*([A-Za-z]+\s+20[0-9]{2}\s*(?:to|[\-–])\s*[A-Za-z]+\s+20[0-9]{2})/i)?.[1] || 'N/A',
+    statementPeriod: text.match(periodPatterns.statementPeriod)?.[1] || 'N/A',
     accountNumber: extractFirstMatch(text, bankStatementPatterns.accountNumber) || 'N/A',
   };
 };
@@ -121,11 +126,11 @@ const extractBankStatement = (text: string): BankStatementData => {
 const extractGSTReturns = (text: string): GSTReturnsData => {
   // Determine filing regularity based on keywords
   let filingRegularity: GSTReturnsData['filingRegularity'] = 'unknown';
-  if (/regular(?:ly)?\s+fil(?:ed|ing)/i.test(text) || /on[\-\s]?time/i.test(text)) {
+  if (filingRegularityPatterns.regular.test(text)) {
     filingRegularity = 'regular';
-  } else if (/irregular|late|delayed/i.test(text)) {
+  } else if (filingRegularityPatterns.irregular.test(text)) {
     filingRegularity = 'irregular';
-  } else if (/delay/i.test(text)) {
+  } else if (filingRegularityPatterns.delayed.test(text)) {
     filingRegularity = 'delayed';
   }
 
@@ -135,7 +140,7 @@ const extractGSTReturns = (text: string): GSTReturnsData => {
     inputCredit: formatCurrency(extractFirstMatch(text, gstPatterns.inputCredit)),
     filingRegularity,
     gstNumber: extractFirstMatch(text, gstPatterns.gstNumber) || 'N/A',
-    reportPeriod: text.match(/(?:period|month|quarter)\s*[:\-]?\s*([A-Za-z]+\s+20[0-9]{2})/i)?.[1] || 'N/A',
+    reportPeriod: text.match(periodPatterns.reportPeriod)?.[1] || 'N/A',
   };
 };
 
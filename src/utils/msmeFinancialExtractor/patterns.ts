@@ -4,16 +4,15 @@ export const currencyPattern = /(?:₹|Rs\.?|INR)\s*([0-9,]+(?:\.[0-9]{1,2})?(?:
 export const percentagePattern = /([0-9]+(?:\.[0-9]{1,2})?)\s*%/g;
 export const numberPattern = /([0-9,]+(?:\.[0-9]{1,2})?)/g;
 
+// Labels sharing a value tail are one alternation; the leftmost label wins
+
 // Balance Sheet patterns
 export const balanceSheetPatterns = {
   totalAssets: [
-    /total\s+assets?\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
-    /assets?\s+total\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
-    /total\s+of\s+assets?\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
+    /(?:total\s+(?:of\s+)?assets?|assets?\s+total)\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
   ],
   totalLiabilities: [
-    /total\s+liabilities?\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
-    /liabilities?\s+total\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
+    /(?:total\s+liabilities?|liabilities?\s+total)\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
   ],
   currentAssets: [
     /current\s+assets?\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
@@ -101,8 +100,7 @@ export const bankStatementPatterns = {
     /([0-9]+)\s+cheques?\s+(?:bounced?|returned?|dishonoured?)/i,
   ],
   accountNumber: [
-    /a\/c\s*(?:no\.?|number)\s*[:\-]?\s*([0-9]{9,18})/i,
-    /account\s*(?:no\.?|number)\s*[:\-]?\s*([0-9]{9,18})/i,
+    /(?:a\/c|account)\s*(?:no\.?|number)\s*[:\-]?\s*([0-9]{9,18})/i,
   ],
 };
 
@@ -121,8 +119,7 @@ export const gstPatterns = {
     /itc\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
   ],
   gstNumber: [
-    /gstin?\s*[:\-]?\s*([0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][0-9A-Z][Z][0-9A-Z])/i,
-    /gst\s*(?:no\.?|number)\s*[:\-]?\s*([0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][0-9A-Z][Z][0-9A-Z])/i,
+    /gst(?:in?|\s*(?:no\.?|number))\s*[:\-]?\s*([0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][0-9A-Z][Z][0-9A-Z])/i,
   ],
 };
 
@@ -151,28 +148,16 @@ export const itrPatterns = {
   ],
 };
 
-// CIBIL patterns
-export const cibilPatterns = {
-  creditScore: [
-    /(?:cibil\s+)?(?:credit\s+)?score\s*[:\-]?\s*([3-9][0-9]{2})/i,
-    /score\s*[:\-]?\s*([3-9][0-9]{2})/i,
-  ],
-  activeLoans: [
-    /active\s+(?:loan)?accounts?\s*[:\-]?\s*([0-9]+)/i,
-    /(?:no\.?\s+of\s+)?active\s+loans?\s*[:\-]?\s*([0-9]+)/i,
-  ],
-  defaults: [
-    /defaults?\s*[:\-]?\s*([0-9]+)/i,
-    /(?:no\.?\s+of\s+)?default\s+accounts?\s*[:\-]?\s*([0-9]+)/i,
-  ],
-  overdue: [
-    /(?:amount\s+)?overdue\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
-    /overdue\s+amount\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
-  ],
-  totalLoanAmount: [
-    /(?:total\s+)?(?:outstanding|loan)\s+(?:balance|amount)\s*[:\-]?\s*(?:₹|Rs\.?|INR)?\s*([0-9,]+(?:\.[0-9]{1,2})?)/i,
-  ],
-  settledAccounts: [
-    /settled\s+accounts?\s*[:\-]?\s*([0-9]+)/i,
-  ],
+// Reporting period patterns shared across document types
+export const periodPatterns = {
+  fiscalYear: /(?:fy|fiscal\s+year|year)\s*[:\-]?\s*(20[0-9]{2}[\-\s]?(?:20)?[0-9]{2})/i,
+  statementPeriod: /(?:period|from)\s*[:\-]?\s*([A-Za-z]+\s+20[0-9]{2}\s*(?:to|[\-–])\s*[A-Za-z]+\s+20[0-9]{2})/i,
+  reportPeriod: /(?:period|month|quarter)\s*[:\-]?\s*([A-Za-z]+\s+20[0-9]{2})/i,
+};
+
+// GST filing regularity indicators, checked in this order
+export const filingRegularityPatterns = {
+  regular: /regular(?:ly)?\s+fil(?:ed|ing)|on[\-\s]?time/i,
+  irregular: /irregular|late|delayed/i,
+  delayed: /delay/i,
 };
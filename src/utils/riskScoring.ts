@@ -207,53 +207,66 @@ export const calculateRiskScore = (
   };
 };
 
-// Generate risk alerts from applications
-export const generateRiskAlerts = (applications: LoanApplication[]): RiskAlert[] => {
+const SEVERITY_ORDER: Record<RiskScore['severity'], number> = { critical: 0, high: 1, medium: 2, low: 3 };
+
+// Build alerts from risk scores already computed for each application;
+// risks[i] belongs to applications[i]
+const buildRiskAlerts = (applications: LoanApplication[], risks: RiskScore[]): RiskAlert[] => {
   const alerts: RiskAlert[] = [];
 
-  applications.forEach(app => {
-    const riskScore = calculateRiskScore(app);
+  applications.forEach((app, i) => {
+    const { severity, flags, overall } = risks[i];
 
-    if (riskScore.severity === 'critical' || riskScore.severity === 'high') {
+    if (severity === 'critical' || severity === 'high') {
+      const topFlag = flags[0];
       alerts.push({
         id: `alert_${app.id}_${Date.now()}`,
         applicationId: app.id,
         businessName: app.businessName,
-        severity: riskScore.severity,
-        title: riskScore.flags[0]?.title || 'High Risk Application',
-        description: riskScore.flags[0]?.description || `Risk score: ${riskScore.overall}`,
+        severity,
+        title: topFlag?.title || 'High Risk Application',
+        description: topFlag?.description || `Risk score: ${overall}`,
         timestamp: new Date().toISOString(),
-        actionRequired: riskScore.severity === 'critical'
+        actionRequired: severity === 'critical'
       });
     }
   });
 
   // Sort by severity and timestamp
   return alerts.sort((a, b) => {
-    const severityOrder = { critical: 0, high: 1, medium: 2, low: 3 };
-    if (severityOrder[a.severity] !== severityOrder[b.severity]) {
-      return severityOrder[a.severity] - severityOrder[b.severity];
+    const severityA = SEVERITY_ORDER[a.severity];
+    const severityB = SEVERITY_ORDER[b.severity];
+    if (severityA !== severityB) {
+      return severityA - severityB;
     }
     return new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime();
   });
 };
 
+// Generate risk alerts from applications
+export const generateRiskAlerts = (applications: LoanApplication[]): RiskAlert[] =>
+  buildRiskAlerts(applications, applications.map(app => calculateRiskScore(app)));
+
 // Calculate portfolio-level risk summary
 export const calculatePortfolioRisk = (applications: LoanApplication[]): PortfolioRiskSummary => {
-  const riskScores = applications.map(app => ({
-    app,
-    risk: calculateRiskScore(app)
-  }));
-
-  const distribution = {
-    low: riskScores.filter(r => r.risk.severity === 'low').length,
-    medium: riskScores.filter(r => r.risk.severity === 'medium').length,
-    high: riskScores.filter(r => r.risk.severity === 'high').length,
-    critical: riskScores.filter(r => r.risk.severity === 'critical').length,
+  // Risk score per application (index-aligned), reused for the alerts below
+  const risks: RiskScore[] = new Array(applications.length);
+  const distribution: PortfolioRiskSummary['riskDistribution'] = {
+    low: 0,
+    medium: 0,
+    high: 0,
+    critical: 0,
   };
+  let totalRiskScore = 0;
+  applications.forEach((app, i) => {
+    const risk = calculateRiskScore(app);
+    risks[i] = risk;
+    distribution[risk.severity]++;
+    totalRiskScore += risk.overall;
+  });
 
-  const avgRiskScore = riskScores.length > 0
-    ? riskScores.reduce((sum, r) => sum + r.risk.overall, 0) / riskScores.length
+  const avgRiskScore = applications.length > 0
+    ? totalRiskScore / applications.length
     : 0;
 
   // Sector concentration (using business type as proxy)
@@ -282,7 +295,7 @@ export const calculatePortfolioRisk = (applications: LoanApplication[]): Portfol
     totalApplications: applications.length,
     averageRiskScore: Math.round(avgRiskScore),
     riskDistribution: distribution,
-    topRisks: generateRiskAlerts(applications).slice(0, 5),
+    topRisks: buildRiskAlerts(applications, risks).slice(0, 5),
     sectorConcentration,
     trends,
   };
@@ -0,0 +1,30 @@
+// Word, sentence and paragraph counts for extracted document text
+
+export interface TextStats {
+  characters: number;
+  words: number;
+  sentences: number;
+  paragraphs: number;
+}
+
+// Each pattern matches exactly one counted unit
+const WORD_PATTERN = /\S+/g;
+// A sentence starts at the first non-space character after a terminator
+const SENTENCE_PATTERN = /[^.!?\s][^.!?]*/g;
+// Non-space runs joined by whitespace holding at most one line break; a blank
+// line ends the paragraph
+const PARAGRAPH_PATTERN = /\S(?:[^\S\n]*(?:\n[^\S\n]*)?\S)*/g;
+
+const countMatches = (text: string, pattern: RegExp): number => {
+  let count = 0;
+  pattern.lastIndex = 0;
+  while (pattern.test(text)) count++;
+  return count;
+};
+
+export const getTextStats = (text: string): TextStats => ({
+  characters: text.length,
+  words: countMatches(text, WORD_PATTERN),
+  sentences: countMatches(text, SENTENCE_PATTERN),
+  paragraphs: countMatches(text, PARAGRAPH_PATTERN)
+});